@@ -68,7 +68,7 @@ class ArgumentReader(DataReader):
         # get positional argument names from parameters and apply them to args
         # update data with additional kwargs
         argpos = {
-            v['extras']['argpos']: k for k, v in self.parameters.iteritems()
+            v['extras']['argpos']: k for k, v in self.parameters.items()
             if 'argpos' in v['extras']
         }
         data = dict(
@@ -87,7 +87,7 @@ class ArgumentReader(DataReader):
         :return: data with units applied
         """
         # if units key exists then apply
-        for k, v in self.parameters.iteritems():
+        for k, v in self.parameters.items():
             if v and v.get('units'):
                 data[k] = Q_(data[k], v.get('units'))
         return data
@@ -147,7 +147,7 @@ class HDF5Reader(ArgumentReader):
     def load_data(self, h5file, *args, **kwargs):
         with h5py.File(h5file) as h5f:
             h5data = dict.fromkeys(self.parameters)
-            for param, attrs in self.parameters.iteritems():
+            for param, attrs in self.parameters.items():
                 LOGGER.debug('parameter:\n%r', param)
                 node = attrs['extras']['node']  # full name of node
                 # composite datatype member
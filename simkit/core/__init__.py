@@ -20,7 +20,8 @@ section.
 
 import pint
 import os
-from inspect import getargspec
+import copy
+from inspect import getfullargspec
 import functools
 import json
 import numpy as np
@@ -31,6 +32,12 @@ from simkit.core.exceptions import (
     DuplicateRegItemError, MismatchRegMetaKeysError
 )
 
+# try to use orjson if available, otherwise fall back on json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 warnings.simplefilter('always', DeprecationWarning)
 logging.captureWarnings(True)
 # create default logger from root logger with debug level, stream handler and
@@ -42,6 +49,9 @@ logging.basicConfig(datefmt=LOG_DATEFMT, format=LOG_FORMAT)
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
 
+# parameters from JSON files keyed by path, modification time and size
+_PARAM_CACHE = {}
+
 # unit registry, quantity constructor and extra units registry definitions
 UREG = pint.UnitRegistry()  # registry of units
 Q_ = UREG.Quantity  # quantity constructor for ambiguous quantities like degC
@@ -117,8 +127,9 @@ class Registry(dict):
             :exc:`~simkit.core.exceptions.MismatchRegMetaKeysError`
         """
         newkeys = newitems.keys()  # set of the new item keys
-        if any(self.keys() & newkeys):  # duplicates
-            raise DuplicateRegItemError(self.keys() & newkeys)
+        duplicates = self.keys() & newkeys
+        if duplicates:
+            raise DuplicateRegItemError(duplicates)
         self.update(newitems)  # register new item
         # update meta fields
         kwargs.update(zip(self.meta_names, args))
@@ -177,7 +188,7 @@ def convert_args(test_fcn, *test_args):
     def wrapper(origfcn):
         @functools.wraps(origfcn)
         def newfcn(*args, **kwargs):
-            argspec = getargspec(origfcn)  # use ``inspect`` to get arg names
+            argspec = getfullargspec(origfcn)  # get arg names
             kwargs.update(zip(argspec.args, args))  # convert args to kw
             # loop over test args
             for a in test_args:
@@ -223,6 +234,46 @@ class SimKitJSONEncoder(json.JSONEncoder):
             return super(SimKitJSONEncoder, self).default(o)
 
 
+def _load_params(param_file):
+    """
+    Load JSON parameter file, or a copy of the parameters already loaded if
+    the file hasn't been modified since.
+
+    :param param_file: name of JSON parameter file
+    :type param_file: str
+    :return: parameters
+    :rtype: dict
+    """
+    st = os.stat(param_file)
+    key = (param_file, st.st_mtime_ns, st.st_size)
+    params = _PARAM_CACHE.get(key)
+    if params is None:
+        params = _PARAM_CACHE[key] = _read_params(param_file)
+    # parameters are modified by the caller, so never return the cached ones
+    return copy.deepcopy(params)
+
+
+def _read_params(param_file):
+    """
+    Read JSON parameter file using :mod:`orjson` if installed, otherwise
+    :mod:`json`.
+
+    :param param_file: name of JSON parameter file
+    :type param_file: str
+    :return: parameters
+    :rtype: dict
+    """
+    # both parsers accept bytes, so skip decoding the file as text
+    with open(param_file, 'rb') as fp:
+        param_bytes = fp.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(param_bytes)
+        except orjson.JSONDecodeError:
+            pass  # json also accepts NaN and Infinity
+    return json.loads(param_bytes)
+
+
 def get_public_attributes(cls, as_list=True):
     """
     Return class attributes that are neither private nor magic.
@@ -313,29 +364,28 @@ class CommonBase(type):
         cls_path = getattr(meta, mcs._path_attr, None)
         cls_file = getattr(meta, mcs._file_attr, None)
         # read parameters
-        attr[mcs._param_attr] = {}
+        parameters = attr[mcs._param_attr] = {}
         attr[mcs._param_file] = None
         # read parameters from file
-        if None not in [cls_path, cls_file]:
+        if cls_path is not None and cls_file is not None:
             param_file = os.path.join(cls_path, cls_file)
             attr[mcs._param_file] = param_file
             # read and load JSON parameter map file as "parameters"
-            with open(param_file, 'r') as param_file:
-                file_params = json.load(param_file)
+            file_params = _load_params(param_file)
             # update meta from file
             for k, v in file_params.pop(mcs._meta_cls, {}).items():
                 setattr(meta, k, v)
             # dictionary of parameters for reading source file
-            attr[mcs._param_attr] = {
+            parameters = attr[mcs._param_attr] = {
                 k: mcs._param_cls(**v) for k, v in file_params.items()
             }
-        # get parameters from class
-        parameters = dict.fromkeys(
-            k for k, v in attr.items() if isinstance(v, Parameter)
-        )
+        # get parameters from class, private and magic attributes are never
+        # parameters so skip them without checking their type
+        param_keys = [k for k, v in attr.items()
+                      if k[:1] != '_' and isinstance(v, Parameter)]
         # update parameters
-        for k in parameters:
-            attr[mcs._param_attr][k] = attr.pop(k)
+        for k in param_keys:
+            parameters[k] = attr.pop(k)
         return attr
 
     @staticmethod
@@ -5,11 +5,35 @@ This module provides base classes for calculations. All calculations should
 inherit from one of the calcs in this module.
 """
 
-from past.builtins import basestring
-from simkit.core import logging, CommonBase, Registry, UREG, Parameter
+from simkit.core import (
+    logging, _listify, CommonBase, Registry, UREG, Q_, Parameter
+)
 from simkit.core.calculators import Calculator
 
 LOGGER = logging.getLogger(__name__)
+_FREQ_UNITS = {}  # cache of units parsed from frequencies
+
+
+def _get_frequency(freq):
+    """
+    Convert frequency to number of intervals or quantity of time.
+
+    :param freq: frequency as ``[value, units]``, empty units means intervals
+    :return: number of intervals or quantity of time
+    """
+    # already a quantity or a number of intervals
+    if isinstance(freq, Q_) or not isinstance(freq, (list, tuple)):
+        return freq
+    value, units = freq
+    units = str(units)
+    # plain numbers keep modulo of interval indices out of Pint
+    if not units:
+        return value
+    try:
+        units = _FREQ_UNITS[units]
+    except KeyError:
+        units = _FREQ_UNITS[units] = UREG(units)
+    return value * units
 
 
 class CalcParameter(Parameter):
@@ -17,7 +41,7 @@ class CalcParameter(Parameter):
     Fields for calculations.
     """
     _attrs = ['dependencies', 'always_calc', 'frequency', 'formula', 'args',
-              'returns', 'calculator', 'is_dynamic']
+              'returns', 'calculator', 'is_dynamic', 'vectorizable']
 
 
 class CalcRegistry(Registry):
@@ -33,26 +57,27 @@ class CalcRegistry(Registry):
     calculated first. Calculations marked as `always_calc` will not be limited
     by thresholds set in simulations. The frequency determines how often to
     dynamic calculations occur. Frequency can be given in intervals or can list
-    a quantity of time, _EG:_ ``2 * UREG.hours``.
+    a quantity of time, _EG:_ ``2 * UREG.hours``. Dynamic calculations marked
+    as `vectorizable` are elementwise in time, so they can be calculated over a
+    range of intervals at once.
     """
     #: meta names
     meta_names = ['dependencies', 'always_calc', 'frequency', 'calculator',
-                  'is_dynamic', 'calc_source']
+                  'is_dynamic', 'calc_source', 'vectorizable']
 
     def register(self, new_calc, *args, **kwargs):
         """
         Register calculations and meta data.
 
-        * ``dependencies`` - list of prerequisite calculations
+        * ``dependencies`` - list of prerequisite calculations, :class:`Calc`
+          converts a single dependency to a list
         * ``always_calc`` - ``True`` if calculation ignores thresholds
         * ``frequency`` - frequency of calculation in intervals or units of time
+        * ``vectorizable`` - ``True`` if calculation can be done over a range
 
         :param new_calc: register new calculation
         """
         kwargs.update(zip(self.meta_names, args))
-        # dependencies should be a list of other calculations
-        if isinstance(kwargs['dependencies'], basestring):
-            kwargs['dependencies'] = [kwargs['dependencies']]
         # call super method, now meta can be passed as args or kwargs.
         super(CalcRegistry, self).register(new_calc, **kwargs)
 
@@ -89,12 +114,12 @@ class Calc(metaclass=CalcBase):
         self.always_calc = dict.fromkeys(
             parameters, getattr(meta, 'always_calc', False)
         )
-        freq = getattr(meta, 'frequency', [1, ''])
+        freq = _get_frequency(getattr(meta, 'frequency', [1, '']))
         #: frequency calculation is calculated in intervals or units of time
-        self.frequency = dict.fromkeys(parameters, freq[0] * UREG(str(freq[1])))
-        #: dependencies
+        self.frequency = dict.fromkeys(parameters, freq)
+        #: dependencies, always a list of other calculations
         self.dependencies = dict.fromkeys(
-            parameters, getattr(meta, 'dependencies', [])
+            parameters, _listify(getattr(meta, 'dependencies', []))
         )
         #: name of :class:`Calc` superclass
         self.calc_source = dict.fromkeys(parameters, self.__class__.__name__)
@@ -106,6 +131,10 @@ class Calc(metaclass=CalcBase):
         self.is_dynamic = dict.fromkeys(
             parameters, getattr(meta, 'is_dynamic', False)
         )
+        #: ``True`` if dynamic calculations can be done over a range at once
+        self.vectorizable = dict.fromkeys(
+            parameters, getattr(meta, 'vectorizable', False)
+        )
         #: calculations
         self.calcs = {}
         for k, v in parameters.items():
@@ -113,8 +142,12 @@ class Calc(metaclass=CalcBase):
                 key: v[key] for key in ('formula', 'args', 'returns')
             }
             keys = ('dependencies', 'always_calc', 'frequency', 'calculator',
-                    'is_dynamic')
+                    'is_dynamic', 'vectorizable')
             for key in keys:
                 value = v.get(key)
                 if value is not None:
+                    if key == 'frequency':
+                        value = _get_frequency(value)
+                    elif key == 'dependencies':
+                        value = _listify(value)
                     getattr(self, key)[k] = value
@@ -4,6 +4,7 @@ Calculators are used to execute calculations.
 
 from past.builtins import basestring
 from simkit.core import logging, UREG
+from collections import ChainMap
 import numpy as np
 
 LOGGER = logging.getLogger(__name__)
@@ -21,7 +22,8 @@ def index_registry(args, reg, ts=None, idx=None):
     :type reg: :class:`~simkit.core.data_sources.DataRegistry`,
         :class:`~simkit.core.outputs.OutputRegistry`
     :param ts: Time step [units of time].
-    :param idx: [None] Index of current time step for dynamic calculations.
+    :param idx: [None] Index of current time step for dynamic calculations,
+        or a :class:`slice` of time steps for vectorizable calculations.
 
     Required arguments for static and dynamic calculations are specified in the
     calculation parameter file by the "args" key. Arguments can be from
@@ -64,20 +66,21 @@ def index_registry(args, reg, ts=None, idx=None):
     # TODO: move this to new Registry method or __getitem__
     # TODO: replace idx with datetime object and use timeseries to interpolate
     #       into data, not necessary for outputs since that will conform to idx
-    rargs = dict.fromkeys(args)  # make dictionary from arguments
+    rargs = {}  # dictionary of arguments, filled in same order as args
+    isconstant = reg.isconstant  # bind meta once, used for every argument
     # iterate over arguments
     for k, v in args.items():
-        # var           ------------------ states ------------------
-        # idx           ===== not None =====    ======= None =======
-        # isconstant    True    False   None    True    False   None
-        # is_dynamic    no      yes     yes     no      no      no
-        is_dynamic = idx and not reg.isconstant.get(v)
         # switch based on string type instead of sequence
         if isinstance(v, basestring):
+            # var           ------------------ states ------------------
+            # idx           ===== not None =====    ======= None =======
+            # isconstant    True    False   None    True    False   None
+            # is_dynamic    no      yes     yes     no      no      no
+            is_dynamic = idx is not None and not isconstant.get(v)
             # the default assumes the current index
             rargs[k] = reg[v][idx] if is_dynamic else reg[v]
         elif len(v) < 3:
-            if reg.isconstant[v[0]]:
+            if isconstant[v[0]]:
                 # only get indices specified by v[1]
                 # tuples interpreted as a list of indices, see
                 # NumPy basic indexing: Dealing with variable
@@ -117,47 +120,35 @@ class Calculator(object):
         """
         # number of formula arguments that are not constant
         argn = len(vargs)
-        # number of observations must be the same for all vargs
-        nobs = 1
-        for m in range(argn):
-            a = vargs[m]
+        # resolve registry names and variances of the arguments only once
+        names, avars = [], []
+        for a in vargs:
             try:
                 a = datargs[a]
             except (KeyError, TypeError):
                 a = outargs[a]
-                avar = outvar[a]
+                avars.append(outvar[a])
             else:
-                avar = datvar[a]
-            for n in range(argn):
-                b = vargs[n]
-                try:
-                    b = datargs[b]
-                except (KeyError, TypeError):
-                    b = outargs[b]
-                c = avar.get(b, 0.0)
+                avars.append(datvar[a])
+            names.append(a)
+        # table of covariances, missing covariances default to zero
+        covs = [[avar.get(b, 0.0) for b in names] for avar in avars]
+        # number of observations must be the same for all vargs
+        nobs = 1
+        for m, row in enumerate(covs):
+            for n, c in enumerate(row):
                 try:
                     nobs = max(nobs, len(c))
                 except (TypeError, ValueError):
-                    LOGGER.debug('c of %s vs %s = %g', a, b, c)
-        # covariance matrix is initially zeros
-        cov = np.zeros((nobs, argn, argn))
-        # loop over arguments in both directions, fill in covariance
-        for m in range(argn):
-            a = vargs[m]
-            try:
-                a = datargs[a]
-            except (KeyError, TypeError):
-                a = outargs[a]
-                avar = outvar[a]
-            else:
-                avar = datvar[a]
-            for n in range(argn):
-                b = vargs[n]
-                try:
-                    b = datargs[b]
-                except (KeyError, TypeError):
-                    b = outargs[b]
-                cov[:, m, n] = avar.get(b, 0.0)
+                    LOGGER.debug('c of %s vs %s = %g', names[m], names[n], c)
+        # every cell is assigned below, so skip zeroing the covariance matrix
+        # first, use Fortran order so that each cov[:, m, n] observation slice
+        # is contiguous
+        cov = np.empty((nobs, argn, argn), order='F')
+        # fill in covariance from the table
+        for m, row in enumerate(covs):
+            for n, c in enumerate(row):
+                cov[:, m, n] = c
         if nobs == 1:
             cov = cov.squeeze()  # squeeze out any extra dimensions
         LOGGER.debug('covariance:\n%r', cov)
@@ -184,7 +175,7 @@ class Calculator(object):
         # get the formula-key from each static calc
         formula = calc['formula']  # name of formula in calculation
         func = formula_reg[formula]  # formula function object
-        fargs = formula_reg.args.get(formula, [])  # formula arguments
+        fargs = formula_reg.args.get(formula, ())  # formula arguments
         constants = formula_reg.isconstant.get(formula)  # constant args
         # formula arguments that are not constant
         vargs = [] if constants is None else [a for a in fargs if a not in constants]
@@ -193,8 +184,14 @@ class Calculator(object):
         datargs, outargs = args.get('data', {}), args.get('outputs', {})
         data = index_registry(datargs, data_reg, timestep, idx)
         outputs = index_registry(outargs, out_reg, timestep, idx)
-        kwargs = dict(data, **outputs)  # combined data and output args
-        args = [kwargs.pop(a) for a in fargs if a in kwargs]
+        # combined data and output args, outputs take precedence over data
+        merged = ChainMap(outputs, data)
+        args = [merged[a] for a in fargs if a in merged]
+        # only copy leftover arguments if any aren't positional
+        if len(args) < len(merged):
+            kwargs = {k: v for k, v in merged.items() if k not in fargs}
+        else:
+            kwargs = {}
         returns = calc['returns']  # return arguments
         # if constants is None then the covariance should also be None
         # TODO: except other values, eg: "all" to indicate no covariance
@@ -212,31 +209,40 @@ class Calculator(object):
             # split uncertainty and jacobian from return values
             cov, jac = retval[-2:]
             retval = retval[:-2]
-            # scale covariance
-            scale = np.asarray(
-                [1 / r.m if isinstance(r, UREG.Quantity) else 1 / r
-                 for r in retval]
-            )  # use magnitudes if quantities
-            cov = (np.swapaxes((cov.T * scale), 0, 1) * scale).T
+            # scale covariance, use magnitudes if quantities, the uncertainty
+            # wrapper returns a sequence and units are applied to all returns
+            # or none, so only check the first return
+            if isinstance(retval[0], UREG.Quantity):
+                retval_m = [r.m for r in retval]
+            else:
+                retval_m = retval
+            scale = 1.0 / np.asarray(retval_m, dtype=np.float64)
             nret = len(retval)  # number of return output
-            for m in range(nret):
-                a = returns[m]  # name in output registry
-                out_reg.variance[a] = {}
-                out_reg.uncertainty[a] = {}
-                out_reg.jacobian[a] = {}
-                for n in range(nret):
-                    b = returns[n]
-                    out_reg.variance[a][b] = cov[:, m, n]
-                    if a == b:
-                        unc = np.sqrt(cov[:, m, n]) * 100 * UREG.percent
-                        out_reg.uncertainty[a][b] = unc
-                for n in range(len(vargs)):
-                    b = vargs[n]
-                    try:
-                        b = datargs[b]
-                    except (KeyError, TypeError):
-                        b = outargs[b]
-                    out_reg.jacobian[a][b] = jac[:, m, n]
+            # scale[o, m] is the reciprocal of return m at observation o
+            scale = scale.reshape(nret, -1).T
+            # cov[o, m, n] * scale[o, m] * scale[o, n] in Fortran order so
+            # each cov[:, m, n] slice written to the registry is contiguous
+            cov = np.einsum('omn,om,on->omn', cov, scale, scale, order='F')
+            # registry names of returns and variable arguments, only resolved
+            # once for all returns
+            rnames = returns[:nret]
+            vnames = []
+            for b in vargs:
+                try:
+                    b = datargs[b]
+                except (KeyError, TypeError):
+                    b = outargs[b]
+                vnames.append(b)
+            for m, a in enumerate(rnames):
+                out_reg.variance[a] = {
+                    b: cov[:, m, n] for n, b in enumerate(rnames)
+                }
+                out_reg.uncertainty[a] = {
+                    a: np.sqrt(cov[:, m, m]) * 100 * UREG.percent
+                }
+                out_reg.jacobian[a] = {
+                    b: jac[:, m, n] for n, b in enumerate(vnames)
+                }
                 LOGGER.debug('%s cov:\n%r', a, out_reg.variance[a])
                 LOGGER.debug('%s jac:\n%r', a, out_reg.jacobian[a])
                 LOGGER.debug('%s unc:\n%r', a, out_reg.uncertainty[a])
@@ -257,3 +263,32 @@ class Calculator(object):
                 out_reg[returns[0]] = retval
             else:
                 out_reg[returns[0]][idx] = retval
+
+    @classmethod
+    def calculate_range(cls, calc, formula_reg, data_reg, out_reg,
+                        timestep=None, start=0, stop=None):
+        """
+        Execute a vectorizable calculation over a range of intervals at once.
+
+        The data and output arguments are sliced from ``start`` to ``stop``,
+        the formula is called once with the slices and the return values are
+        put into the output registry over the same range. Only calculations
+        that are elementwise in time, without offsets or time deltas in their
+        arguments, should be calculated over a range.
+
+        :param calc: calculation, with formula, args and return keys
+        :type calc: dict
+        :param formula_reg: Registry of formulas.
+        :type formula_reg: :class:`~simkit.core.FormulaRegistry`
+        :param data_reg: Data registry.
+        :type data_reg: :class:`~simkit.core.data_sources.DataRegistry`
+        :param out_reg: Outputs registry.
+        :type out_reg: :class:`~simkit.core.outputs.OutputRegistry`
+        :param timestep: simulation interval length [time], default is ``None``
+        :param start: first interval index, default is 0
+        :type start: int
+        :param stop: interval index after the last, default is ``None``
+        :type stop: int
+        """
+        cls.calculate(calc, formula_reg, data_reg, out_reg, timestep=timestep,
+                      idx=slice(start, stop))
@@ -5,7 +5,7 @@ This module provides the base classes for data readers, such as
 which are used to read in data sources.
 """
 
-from past.builtins import basestring
+from past.builtins import basestring, long
 from io import StringIO
 from simkit.core import UREG, Q_
 from simkit.core.exceptions import (
@@ -15,16 +15,255 @@ from xlrd import open_workbook
 import csv
 import numpy as np
 import json
+import mmap
 import os
 import time
 import re
 
+# try to use orjson if available, otherwise fall back on json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# try to use ijson if available to stream large files without orjson
+try:
+    import ijson
+except ImportError:
+    ijson = None
+# try to use xxhash if available, otherwise fall back on hashlib
+try:
+    import xxhash
+except ImportError:
+    import hashlib
+    xxhash = None
+
 # regex pattern for %e, %E, %f and %g
 # http://docs.python.org/2/library/re.html#simulating-scanf
 # use (?...) for non capturing groups
 EFG_PATTERN = '([-+]?(?:\\d+(?:\\.\\d*)?|\\.\\d+)(?:[eE][-+]?\\d+)?)'
 # whitelist regex methods
 RE_METH = ['search', 'match', 'findall', 'split']
+# character class of only literal characters, _EG_: "[,;]"
+CHAR_CLASS_PATTERN = re.compile(r'^\[([^\]\\^\-]+)\]$')
+# error message if regex method isn't whitelisted
+RE_METH_MSG = 'Only %s regex methods are allowed.' % ', '.join(
+    '"%s"' % m for m in RE_METH
+)
+# memory map JSON files larger than this many bytes instead of reading them
+JSON_MMAP_SIZE = 8 * 1024 * 1024
+# size of blocks read from files to hash their contents
+HASH_BLOCK_SIZE = 1024 * 1024
+# read text files larger than this many bytes with a buffer of the same size
+TEXT_BUFFER_SIZE = 1024 * 1024
+# stat results of files, and when they were checked, by path
+_STAT_CACHE = {}
+# units parsed from strings, or quantities if units are scaled, _EG_: "1e3*W"
+_UNIT_CACHE = {}
+# regex patterns compiled from strings, the default is compiled at import
+_PATTERN_CACHE = {EFG_PATTERN: re.compile(EFG_PATTERN)}
+# whitelist header types by prefix
+_TYPE_MAP = {
+    'int': int,  # coerce to integer
+    'long': long,  # coerce to long integer
+    'float': float,  # to floating decimal point
+    'str': str,  # coerce to string
+    'bool': bool  # coerce to boolean
+}
+
+
+def _unit(units):
+    """
+    Get units from a string, only parsing each string once. Strings that
+    aren't only units, _EG_: "1e3*W", are parsed as quantities instead.
+
+    :param units: units, use an empty string for dimensionless
+    :type units: str
+    :return: units, or quantity if units are scaled
+    :rtype: :class:`~pint.unit.Unit` or :class:`~pint.unit.Quantity`
+    """
+    try:
+        return _UNIT_CACHE[units]
+    except KeyError:
+        pass
+    try:
+        unit = UREG.parse_units(units)
+    except ValueError:
+        # not only units, so parse as a quantity, same as before
+        unit = UREG(units)
+    return _UNIT_CACHE.setdefault(units, unit)
+
+
+def _quantity(value, units):
+    """
+    Apply units from :func:`_unit` to value, scaling value if units are a
+    quantity.
+
+    :param value: magnitude
+    :param units: units or quantity
+    :return: quantity
+    :rtype: :class:`~pint.unit.Quantity`
+    """
+    if isinstance(units, Q_):
+        return Q_(value, units.units) * units.magnitude
+    return Q_(value, units)
+
+
+def _get_compiled(pattern):
+    """
+    Get compiled regex pattern, only compiling each pattern once.
+
+    :param pattern: regex pattern
+    :type pattern: str
+    :return: compiled pattern
+    """
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+
+def _trivial_split_chars(pattern):
+    """
+    Get the characters of a pattern that is only a character class of
+    literal characters, _EG_: "[,;]".
+
+    :param pattern: regex pattern
+    :type pattern: str
+    :return: characters in class or ``None`` if pattern isn't trivial
+    :rtype: str
+    """
+    match = CHAR_CLASS_PATTERN.match(pattern)
+    return match.group(1) if match else None
+
+
+def _split_chars(chars):
+    """
+    Make a function that splits strings on any of the given characters
+    without using regex.
+
+    :param chars: characters to split on
+    :type chars: str
+    :return: split function
+    """
+    # replace all characters with the 1st, then split on it
+    table = str.maketrans(dict.fromkeys(chars[1:], chars[0]))
+
+    def split(string):
+        return string.translate(table).split(chars[0])
+
+    return split
+
+
+def _file_hash(filename):
+    """
+    Hash contents of a file using :mod:`xxhash` if installed, otherwise
+    :mod:`hashlib`. The hash is prefixed with the name of the algorithm.
+
+    :param filename: name of file to hash
+    :type filename: str
+    :return: hash of file contents
+    :rtype: str
+    """
+    if xxhash is None:
+        algorithm, file_hash = 'blake2b', hashlib.blake2b()
+    else:
+        algorithm, file_hash = 'xxh64', xxhash.xxh64()
+    with open(filename, 'rb') as fid:
+        for block in iter(lambda: fid.read(HASH_BLOCK_SIZE), b''):
+            file_hash.update(block)
+    return '%s:%s' % (algorithm, file_hash.hexdigest())
+
+
+def _cached_stat(path, ttl=1.0):
+    """
+    Get status of a file, reusing it if checked within ``ttl``.
+
+    :param path: name of file
+    :type path: str
+    :param ttl: seconds to reuse status [1.0]
+    :type ttl: float
+    :return: size, modification time, etc. of file
+    :rtype: :class:`os.stat_result`
+
+    Use ``_STAT_CACHE.clear()`` to force all files to be checked again.
+    """
+    now = time.time()
+    try:
+        st, checked_at = _STAT_CACHE[path]
+    except KeyError:
+        pass
+    else:
+        if now - checked_at < ttl:
+            return st
+    st = os.stat(path)
+    _STAT_CACHE[path] = (st, now)
+    return st
+
+
+def _load_json(filename):
+    """
+    Load JSON file using :mod:`orjson` if installed, otherwise :mod:`json`.
+    Large files are streamed with :mod:`ijson` if it is installed but
+    :mod:`orjson` isn't.
+
+    :param filename: name of JSON file
+    :type filename: str
+    :return: JSON data
+    """
+    if orjson is None:
+        # stream large files so the whole text isn't read into memory first,
+        # the top level values are still all loaded, so only the text buffer
+        # is saved
+        if ijson and os.path.getsize(filename) > JSON_MMAP_SIZE:
+            try:
+                with open(filename, 'rb') as fid:
+                    return dict(ijson.kvitems(fid, '', use_float=True))
+            except ijson.JSONError:
+                # json writes NaN and Infinity, which ijson rejects
+                pass
+    else:
+        try:
+            return _orjson_load(filename)
+        except orjson.JSONDecodeError:
+            # json writes NaN and Infinity, which orjson rejects
+            pass
+    with open(filename, 'r') as fid:
+        return json.load(fid)
+
+
+def _orjson_load(filename):
+    """
+    Load JSON file using :mod:`orjson`, memory mapping large files.
+
+    :param filename: name of JSON file
+    :type filename: str
+    :return: JSON data
+    """
+    with open(filename, 'rb') as fid:
+        # small files are faster to read than to map
+        if os.fstat(fid.fileno()).st_size <= JSON_MMAP_SIZE:
+            return orjson.loads(fid.read())
+        # parse large files directly from the page cache
+        mm = mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            with memoryview(mm) as buf:
+                return orjson.loads(buf)
+        finally:
+            mm.close()
+
+
+def _open_text(filename):
+    """
+    Open a text file for reading, with a large buffer if the file is large.
+
+    :param filename: Name of text file to open.
+    :type filename: str
+    :returns: File object opened for reading.
+    """
+    # the default buffer is only a few KiB, so large files take many reads
+    if os.path.getsize(filename) > TEXT_BUFFER_SIZE:
+        return open(filename, 'r', buffering=TEXT_BUFFER_SIZE)
+    return open(filename, 'r')
 
 
 class DataReader(object):
@@ -36,12 +275,16 @@ class DataReader(object):
     """
     #: True if reader accepts ``filename`` argument
     is_file_reader = True  # overload in subclasses
+    #: True if reader returns magnitudes and keeps units in :attr:`units`
+    return_magnitudes = False  # overload in subclasses
 
     def __init__(self, parameters, meta=None):
         #: parameters to be read by reader
         self.parameters = parameters
         #: meta if any
         self.meta = meta
+        #: units of data loaded if :attr:`return_magnitudes` is ``True``
+        self.units = {}
 
     def load_data(self, *args, **kwargs):
         """
@@ -68,6 +311,26 @@ class DataReader(object):
         """
         raise NotImplementedError('apply_units_to_cache')
 
+    def _magnitudes(self, data):
+        """
+        Replace quantities with their magnitudes and save their units in
+        :attr:`units` if :attr:`return_magnitudes` is ``True``.
+
+        :param data: data loaded by reader
+        :type data: dict
+        :return: data, with magnitudes if :attr:`return_magnitudes`
+        :rtype: dict
+        """
+        if not self.return_magnitudes:
+            return data
+        # only keep units of data that's still loaded
+        self.units = {k: u for k, u in self.units.items() if k in data}
+        for k, v in data.items():
+            if isinstance(v, Q_):
+                self.units[k] = v.units
+                data[k] = v.magnitude
+        return data
+
 
 class JSONReader(DataReader):
     """
@@ -141,27 +404,51 @@ class JSONReader(DataReader):
         if not filename.endswith('.json'):
             filename += '.json'  # append "json" to filename
         # open file and load JSON data
-        with open(filename, 'r') as fid:
-            json_data = json.load(fid)
+        json_data = _load_json(filename)
         # if JSONReader is the original reader then apply units and return
         if (not self.orig_data_reader or
                 isinstance(self, self.orig_data_reader)):
-            return self.apply_units_to_cache(json_data['data'])
+            return self._magnitudes(
+                self.apply_units_to_cache(json_data['data'])
+            )
+        # size, modification time and content hash of original file when JSON
+        # file was saved
+        orig_size = json_data.get('orig_size')
+        orig_mtime_ns = json_data.get('orig_mtime_ns')
+        content_hash = json_data.get('content_hash')
         # last modification since JSON file was saved
         utc_mod_time = json_data.get('utc_mod_time')
         # instance of original data reader with original parameters
         orig_data_reader_obj = self.orig_data_reader(self.parameters, self.meta)
-        # check if file has been modified since saved as JSON file
-        if utc_mod_time:
+        orig_filename = filename[:-5]  # original filename
+        # check if file has been changed since saved as JSON file, use content
+        # hash if saved since modification times aren't always reliable
+        if content_hash:
+            # compare sizes first, only hash original file if sizes match and
+            # it was modified since it was saved, always stat the file again
+            # since it decides whether the cache is still valid
+            orig_stat = os.stat(orig_filename)
+            if orig_stat.st_size != orig_size:
+                is_changed = True
+            elif orig_stat.st_mtime_ns == orig_mtime_ns:
+                is_changed = False
+            else:
+                is_changed = _file_hash(orig_filename) != content_hash
+        elif utc_mod_time:
             # convert to ordered tuple
             utc_mod_time = time.struct_time(utc_mod_time)
-            orig_filename = filename[:-5]  # original filename
             # use original file if it's been modified since JSON file saved
-            if utc_mod_time < time.gmtime(os.path.getmtime(orig_filename)):
-                os.remove(filename)  # delete JSON file
-                return orig_data_reader_obj.load_data(orig_filename)
+            orig_stat = os.stat(orig_filename)
+            is_changed = utc_mod_time < time.gmtime(orig_stat.st_mtime)
+        else:
+            is_changed = False
+        if is_changed:
+            os.remove(filename)  # delete JSON file
+            return orig_data_reader_obj.load_data(orig_filename)
         # use JSON file if original file hasn't been modified
-        return orig_data_reader_obj.apply_units_to_cache(json_data['data'])
+        return orig_data_reader_obj._magnitudes(
+            orig_data_reader_obj.apply_units_to_cache(json_data['data'])
+        )
 
     def apply_units_to_cache(self, data):
         """
@@ -173,7 +460,7 @@ class JSONReader(DataReader):
         """
         for k, val in self.parameters.items():
             if 'units' in val:
-                data[k] = Q_(data[k], val.get('units'))
+                data[k] = _quantity(data[k], _unit(str(val.get('units') or '')))
         return data
 
 
@@ -241,6 +528,10 @@ class XLRDReader(DataReader):
     8762. Don't forget that indexing starts at 0, so row 2 is the 3rd row.
     """
 
+    #: True to save numeric data to a NumPy ".npz" file next to the workbook,
+    #: and to load it instead if the workbook hasn't been modified since
+    npz_cache = False  # overload in subclasses
+
     def load_data(self, filename, *args, **kwargs):
         """
         Load parameters from Excel spreadsheet.
@@ -250,65 +541,160 @@ class XLRDReader(DataReader):
         :returns: Data read from Excel workbook.
         :rtype: dict
         """
-        # workbook read from file
-        workbook = open_workbook(filename, verbosity=True)
+        if self.npz_cache:
+            data = self._load_npz(filename)
+            if data is not None:
+                return self._magnitudes(data)
+        data = self._load_workbook(filename)
+        if self.npz_cache:
+            self._save_npz(filename, data)
+        return self._magnitudes(data)
+
+    def _load_workbook(self, filename):
+        """
+        Read parameters from Excel workbook.
+
+        :param filename: Name of Excel workbook with data.
+        :type filename: str
+        :returns: Data read from Excel workbook.
+        :rtype: dict
+        """
+        # workbook read from file, only load sheets when they're needed
+        workbook = open_workbook(filename, on_demand=True)
         data = {}  # an empty dictionary to store data
-        # iterate through sheets in parameters
-        # iterate through the parameters on each sheet
+        # group parameters by sheet so each sheet is only loaded once
+        sheets = {}
         for param, pval in self.parameters.items():
-            sheet = pval['extras']['sheet']
-            # get each worksheet from the workbook
-            worksheet = workbook.sheet_by_name(sheet)
-            # split the parameter's range elements
-            prng0, prng1 = pval['extras']['range']
-            # missing "units", json ``null`` and Python ``None`` all OK!
-            # convert to str from unicode, None to '' (dimensionless)
-            punits = str(pval.get('units') or '')
-            # replace None with empty list
-            if prng0 is None:
-                prng0 = []
-            if prng1 is None:
-                prng1 = []
-            # FIXME: Use duck-typing here instead of type-checking!
-            # if both elements in range are `int` then parameter is a cell
-            if isinstance(prng0, int) and isinstance(prng1, int):
-                datum = worksheet.cell_value(prng0, prng1)
-            # if the either element is a `list` then parameter is a slice
-            elif isinstance(prng0, list) and isinstance(prng1, int):
-                datum = worksheet.col_values(prng1, *prng0)
-            elif isinstance(prng0, int) and isinstance(prng1, list):
-                datum = worksheet.row_values(prng0, *prng1)
-            # if both elements are `list` then parameter is 2-D
-            else:
-                datum = []
-                for col in xrange(prng0[1], prng1[1]):
-                    datum.append(worksheet.col_values(col, prng0[0],
-                                                      prng1[0]))
-            # duck typing that datum is real
+            sheets.setdefault(pval['extras']['sheet'], []).append((param, pval))
+        try:
+            # read one sheet at a time, and unload it when it's read
+            for sheet, sheet_params in sheets.items():
+                worksheet = workbook.sheet_by_name(sheet)
+                data.update(self._read_sheet(worksheet, sheet_params))
+                workbook.unload_sheet(sheet)
+        finally:
+            workbook.release_resources()
+        return data
+
+    def _load_npz(self, filename):
+        """
+        Load data from the ".npz" file saved next to an Excel workbook.
+
+        :param filename: Name of Excel workbook with data.
+        :type filename: str
+        :returns: Data with units applied, or ``None`` if there's no ".npz"
+            file, if the workbook is newer, or if any parameters are missing.
+        :rtype: dict
+        """
+        npz_file = filename + '.npz'
+        try:
+            is_changed = os.path.getmtime(npz_file) < os.path.getmtime(filename)
+        except OSError:
+            return None  # no ".npz" file
+        if is_changed:
+            return None
+        with np.load(npz_file) as npz:
+            if set(npz.files) != set(self.parameters):
+                return None
+            return {
+                param: _quantity(
+                    npz[param], _unit(str(pval.get('units') or ''))
+                )
+                for param, pval in self.parameters.items()
+            }
+
+    @staticmethod
+    def _save_npz(filename, data):
+        """
+        Save numeric data to a ".npz" file next to an Excel workbook.
+
+        :param filename: Name of Excel workbook with data.
+        :type filename: str
+        :param data: Data read from Excel workbook.
+        :type data: dict
+        """
+        # only save if all data is numeric, strings would need to be pickled
+        if not all(isinstance(v, Q_) for v in data.values()):
+            return
+        np.savez(filename + '.npz', **{k: v.magnitude for k, v in data.items()})
+
+    @classmethod
+    def _read_sheet(cls, worksheet, sheet_params):
+        """
+        Read the ranges of all parameters on a worksheet.
+
+        :param worksheet: Worksheet with data.
+        :type worksheet: :class:`xlrd.sheet.Sheet`
+        :param sheet_params: List of (name, parameter) on worksheet.
+        :type sheet_params: list
+        :returns: Data read from worksheet.
+        :rtype: dict
+        """
+        return {param: cls._read_range(worksheet, pval)
+                for param, pval in sheet_params}
+
+    @staticmethod
+    def _read_range(worksheet, pval):
+        """
+        Read the range of a parameter from a worksheet.
+
+        :param worksheet: Excel worksheet with data.
+        :type worksheet: :class:`xlrd.sheet.Sheet`
+        :param pval: Parameter with range and units.
+        :type pval: :class:`~simkit.core.data_sources.DataParameter`
+        :returns: Data read from worksheet.
+        """
+        # split the parameter's range elements
+        prng0, prng1 = pval['extras']['range']
+        # missing "units", json ``null`` and Python ``None`` all OK!
+        # convert to str from unicode, None to '' (dimensionless)
+        punits = str(pval.get('units') or '')
+        # replace None with empty list
+        if prng0 is None:
+            prng0 = []
+        if prng1 is None:
+            prng1 = []
+        # FIXME: Use duck-typing here instead of type-checking!
+        # if both elements in range are `int` then parameter is a cell
+        if isinstance(prng0, int) and isinstance(prng1, int):
+            datum = worksheet.cell_value(prng0, prng1)
+        # if the either element is a `list` then parameter is a slice
+        elif isinstance(prng0, list) and isinstance(prng1, int):
+            datum = worksheet.col_values(prng1, *prng0)
+        elif isinstance(prng0, int) and isinstance(prng1, list):
+            datum = worksheet.row_values(prng0, *prng1)
+        # if both elements are `list` then parameter is 2-D, must be real so
+        # fill each column directly into the array
+        else:
+            cols = range(prng0[1], prng1[1])
+            npdatum = np.empty((len(cols), prng1[0] - prng0[0]))
+            for n, col in enumerate(cols):
+                npdatum[n] = worksheet.col_values(col, prng0[0], prng1[0])
+            return _quantity(npdatum, _unit(punits))
+        # check the type of the 1st cell, so only ranges that start with text
+        # can raise ValueError when coercing to float
+        first = datum[0] if isinstance(datum, list) and datum else datum
+        if isinstance(first, basestring):
+            # numbers stored as text are still numbers
             try:
-                npdatum = np.array(datum, dtype=np.float)
-            except ValueError as err:
-                # check for iterable:
-                # if `datum` can't be coerced to float, then it must be
-                # *string* & strings *are* iterables, so don't check!
-                # check for strings:
-                # data must be real or *all* strings!
-                # empty string, None or JSON null also OK
-                # all([]) == True but any([]) == False
-                if not datum:
-                    data[param] = None  # convert empty to None
-                elif all(isinstance(_, basestring) for _ in datum):
-                    data[param] = datum  # all str is OK (EG all 'TMY')
-                elif all(not _ for _ in datum):
-                    data[param] = None  # convert list of empty to None
-                else:
-                    raise err  # raise ValueError if not all real or str
+                npdatum = np.asarray(datum, dtype=np.float64)
+            except ValueError:
+                pass
             else:
-                data[param] = npdatum * UREG(punits)
-            # FYI: only put one statement into try-except test otherwise
-            # might catch different error than expected. use ``else`` as
-            # option to execute only if exception *not* raised.
-        return data
+                return _quantity(npdatum, _unit(punits))
+            # strings *are* iterables, so don't check!
+            # data must be real or *all* strings!
+            # empty string, None or JSON null also OK
+            # all([]) == True but any([]) == False
+            if not datum:
+                return None  # convert empty to None
+            elif all(isinstance(_, basestring) for _ in datum):
+                return datum  # all str is OK (EG all 'TMY')
+            elif all(not _ for _ in datum):
+                return None  # convert list of empty to None
+            # otherwise mixed, so raise ValueError since not all real or str
+        npdatum = np.asarray(datum, dtype=np.float64)
+        return _quantity(npdatum, _unit(punits))
 
     def apply_units_to_cache(self, data):
         """
@@ -323,7 +709,7 @@ class XLRDReader(DataReader):
         for param, pval in self.parameters.items():
             # try to apply units
             try:
-                data[param] *= UREG(str(pval.get('units') or ''))
+                data[param] *= _unit(str(pval.get('units') or ''))
             except TypeError:
                 continue
         return data
@@ -390,17 +776,19 @@ class NumPyLoadTxtReader(DataReader):
         data_units = data_param.get('units', {})  # default is an empty dict
         data = {}  # a dictionary for data
         # open file for reading
-        with open(filename, 'r') as fid:
+        with _open_text(filename) as fid:
             # read header
             if header_param:
                 data.update(_read_header(fid, header_param))
                 fid.seek(0)  # move cursor back to beginning
-            # read data
-            data_data = np.loadtxt(fid, dtype, delimiter=delimiter,
-                                   skiprows=skiprows)
+            # read data, use the pandas C parser for numeric columns
+            data_data = _read_csv_records(fid, dtype, delimiter, skiprows)
+            if data_data is None:
+                data_data = np.loadtxt(fid, dtype, delimiter=delimiter,
+                                       skiprows=skiprows)
         # apply units
         data.update(_apply_units(data_data, data_units, fid.name))
-        return data
+        return self._magnitudes(data)
 
     def apply_units_to_cache(self, data):
         """
@@ -483,7 +871,7 @@ class NumPyGenFromTxtReader(DataReader):
             raise UnnamedDataError(filename)
         data = {}  # a dictionary for data
         # open file for reading
-        with open(filename, 'r') as fid:
+        with _open_text(filename) as fid:
             # read header
             if header_param:
                 data.update(_read_header(fid, header_param))
@@ -495,7 +883,7 @@ class NumPyGenFromTxtReader(DataReader):
                                       deletechars=deletechars)
         # apply units
         data.update(_apply_units(data_data, data_units, fid.name))
-        return data
+        return self._magnitudes(data)
 
     def apply_units_to_cache(self, data):
         """
@@ -504,6 +892,54 @@ class NumPyGenFromTxtReader(DataReader):
         return _apply_units_to_numpy_data_readers(self.parameters, data)
 
 
+def _read_csv_records(f, dtype, delimiter=None, skiprows=None):
+    """
+    Read numeric data with the :func:`pandas.read_csv` C parser, if pandas is
+    installed.
+
+    :param f: File object from which to read data.
+    :type f: file
+    :param dtype: List of (name, type) tuples of the columns.
+    :type dtype: list
+    :param delimiter: Column delimiter, default is ``None`` for whitespace.
+    :param skiprows: Number of lines to skip, default is ``None``.
+    :returns: NumPy structured array or ``None`` if pandas isn't installed, if
+        any of the fields are not numeric scalars, _EG_: strings or
+        sub-arrays, or if the number of columns doesn't match the fields,
+        which are all left to :func:`numpy.loadtxt`.
+    :rtype: :class:`numpy.ndarray`
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    dtype = np.dtype(dtype)
+    names = dtype.names
+    # only plain numeric fields map directly onto pandas columns
+    for name in names:
+        field = dtype.fields[name][0]
+        if field.shape or field.kind not in 'biuf':
+            return None
+    sep = r'\s+' if delimiter is None else delimiter  # same as loadtxt
+    start = f.tell()
+    try:
+        df = pd.read_csv(
+            f, sep=sep, header=None, index_col=False, na_filter=False,
+            dtype={n: dtype.fields[name][0] for n, name in enumerate(names)},
+            skiprows=skiprows or 0, comment='#', engine='c'
+        )
+    except ValueError:
+        df = None
+    # let numpy.loadtxt raise the same errors for missing or extra columns
+    if df is None or len(df.columns) != len(names):
+        f.seek(start)
+        return None
+    data_data = np.empty(len(df), dtype=dtype)
+    for n, name in enumerate(names):
+        data_data[name] = df[n].values
+    return data_data
+
+
 def _apply_units_to_numpy_data_readers(parameters, data):
     """
     Apply units to data originally loaded by :class:`NumPyLoadTxtReader` or
@@ -518,19 +954,18 @@ def _apply_units_to_numpy_data_readers(parameters, data):
     header_param = parameters.get('header')  # default is None
     # check for headers
     if header_param:
-        fields = header_param['fields']  # header fields
-        # dictionary of header field parameters
-        header_fields = {field[0]: field[1:] for field in fields}
-        # loop over fieldnames
-        for k, val in header_fields.items():
+        # loop over header fields, (name, type[, units])
+        for field in header_param['fields']:
             # check for units in header field parameters
-            if len(val) > 1:
-                data[k] *= UREG(str(val[1]))  # apply units
+            if len(field) > 2:
+                # units are parsed once and cached, so fields with the same
+                # units share the same unit object
+                data[field[0]] = _quantity(data[field[0]], _unit(str(field[2])))
     # apply other data units
     data_units = parameters['data'].get('units')  # default is None
     if data_units:
         for k, val in data_units.items():
-            data[k] *= UREG(str(val))  # apply units
+            data[k] = _quantity(data[k], _unit(str(val)))  # apply units
     return data
 
 
@@ -567,45 +1002,55 @@ def _read_header(f, header_param):
     if 'fields' not in header_param:
         raise UnnamedDataError(f.name)
     header_fields = {field[0]: field[1:] for field in header_param['fields']}
+    # resolve the spec'd type of each field once
+    header_types = {k: _header_type(v[0]) for k, v in header_fields.items()}
     # header_names can't be generator b/c DictReader needs list, and can't be
     # dictionary b/c must be same order as 'fields' to match data readby csv
     header_names = [field[0] for field in header_param['fields']]
     # read header
-    header_str = StringIO(f.readline())  # read the 1st line
-    # use csv because it will preserve quoted fields with commas
-    # make a csv.DictReader from header string, use header names for
-    # fieldnames and set delimiter to header delimiter
-    header_reader = csv.DictReader(header_str, header_names,
-                                   delimiter=header_delim,
-                                   skipinitialspace=True)
-    data = header_reader.next()  # parse the header dictionary
+    header_line = f.readline()  # read the 1st line
+    if '"' in header_line or not header_delim.strip():
+        # use csv because it will preserve quoted fields with commas
+        # make a csv.DictReader from header string, use header names for
+        # fieldnames and set delimiter to header delimiter
+        header_reader = csv.DictReader(StringIO(header_line), header_names,
+                                       delimiter=header_delim,
+                                       skipinitialspace=True)
+        data = next(header_reader)  # parse the header dictionary
+    else:
+        # no quoted fields, so just split the line, same as csv would
+        header_values = header_line.rstrip('\r\n').split(header_delim)
+        data = dict(zip(header_names, (v.lstrip(' ') for v in header_values)))
     # iterate over items in data
     for k, v in data.items():
-        header_type = header_fields[k][0]  # spec'd type
-        # whitelist header types
-        if isinstance(header_type, basestring):
-            if header_type.lower().startswith('int'):
-                header_type = int  # coerce to integer
-            elif header_type.lower().startswith('long'):
-                header_type = long  # coerce to long integer
-            elif header_type.lower().startswith('float'):
-                header_type = float  # to floating decimal point
-            elif header_type.lower().startswith('str'):
-                header_type = str  # coerce to string
-            elif header_type.lower().startswith('bool'):
-                header_type = bool  # coerce to boolean
-            else:
-                raise TypeError('"%s" is not a supported type.' % header_type)
-            # WARNING! Use of `eval` considered harmful. `header_type` is read
-            # from JSON file, not secure input, could be used to exploit system
-        data[k] = header_type(v)  # cast v to type
+        data[k] = header_types[k](v)  # cast v to type
         # check for units in 3rd element
         if len(header_fields[k]) > 1:
-            units = UREG(str(header_fields[k][1]))  # spec'd units
+            units = _unit(str(header_fields[k][1]))  # spec'd units
             data[k] = data[k] * units  # apply units
     return data
 
 
+def _header_type(header_type):
+    """
+    Get the type of a header field from its name.
+
+    :param header_type: Name of the type, _EG_: "int" or "float".
+    :returns: The type of the header field.
+    :raises: :exc:`TypeError` if the type isn't supported.
+    """
+    # whitelist header types
+    if not isinstance(header_type, basestring):
+        return header_type
+    # WARNING! Use of `eval` considered harmful. `header_type` is read
+    # from JSON file, not secure input, could be used to exploit system
+    header_type_lower = header_type.lower()
+    for prefix, htype in _TYPE_MAP.items():
+        if header_type_lower.startswith(prefix):
+            return htype
+    raise TypeError('"%s" is not a supported type.' % header_type)
+
+
 def _apply_units(data_data, data_units, fname):
     """
     Apply units to data.
@@ -624,19 +1069,30 @@ def _apply_units(data_data, data_units, fname):
     # raise error if NumPy data doesn't have names
     if not data_names:
         raise UnnamedDataError(fname)
-    data = dict.fromkeys(data_names)  # dictionary of data read by NumPy
-    # iterate over data read by NumPy
-    for data_name in data_names:
-        if data_name in data_units:
-            # if units specified in parameters, then convert to string
-            units = str(data_units[data_name])
-            data[data_name] = data_data[data_name] * UREG(units)
-        elif np.issubdtype(data_data[data_name].dtype, str):
-            # if no units specified and is string
-            data[data_name] = data_data[data_name].tolist()
-        else:
-            data[data_name] = data_data[data_name]
-    return data
+    # dictionary of data read by NumPy, built in one pass over the fields
+    return {data_name: _apply_field_units(data_data[data_name],
+                                          data_units.get(data_name))
+            for data_name in data_names}
+
+
+def _apply_field_units(field, units=None):
+    """
+    Apply units to a field of a NumPy structured array.
+
+    :param field: Field of a NumPy structured array.
+    :type field: :class:`numpy.ndarray`
+    :param units: Units of field, default is ``None`` if no units specified.
+    :returns: Field with units applied, list if field is strings.
+    """
+    # fields of structured arrays are strided views, so copy numeric
+    # fields to contiguous arrays for faster math later
+    if units is not None:
+        # if units specified in parameters, then convert to string
+        return _quantity(np.ascontiguousarray(field), _unit(str(units)))
+    elif np.issubdtype(field.dtype, str):
+        # if no units specified and is string
+        return field.tolist()
+    return np.ascontiguousarray(field)
 
 
 def _utf8_list_to_ascii_tuple(utf8_list):
@@ -647,9 +1103,8 @@ def _utf8_list_to_ascii_tuple(utf8_list):
     :type utf8_list: list
     """
     for n, utf8 in enumerate(utf8_list):
-        utf8_list[n][0] = str(utf8[0])
-        utf8_list[n][1] = str(utf8[1])
-        utf8_list[n] = tuple(utf8)
+        # build a new tuple, so rows that are already tuples also work
+        utf8_list[n] = (str(utf8[0]), str(utf8[1])) + tuple(utf8[2:])
 
 
 class ParameterizedXLS(XLRDReader):
@@ -682,19 +1137,20 @@ class ParameterizedXLS(XLRDReader):
         parameter_name = self.parameterization['parameter']['name']
         parameter_values = self.parameterization['parameter']['values']
         parameter_units = str(self.parameterization['parameter']['units'])
-        data[parameter_name] = parameter_values * UREG(parameter_units)
+        data[parameter_name] = _quantity(
+            parameter_values, _unit(parameter_units)
+        )
         # number of sheets
         num_sheets = len(self.parameterization['parameter']['sheets'])
         # parse and concatenate parameterized data
         for key in self.parameterization['data']:
-            units = str(self.parameterization['data'][key].get('units')) or ''
-            datalist = []
-            for n in xrange(num_sheets):
-                k = key + '_' + str(n)
-                datalist.append(data[k].reshape((1, -1)))
-                data.pop(k)  # remove unused data keys
-            data[key] = np.concatenate(datalist, axis=0) * UREG(units)
-        return data
+            units = str(self.parameterization['data'][key].get('units') or '')
+            # remove unused data keys and stack magnitudes as rows
+            datalist = [data.pop(key + '_' + str(n))
+                        for n in range(num_sheets)]
+            datalist = [getattr(d, 'magnitude', d).ravel() for d in datalist]
+            data[key] = _quantity(np.stack(datalist, axis=0), _unit(units))
+        return self._magnitudes(data)
 
     def apply_units_to_cache(self, data):
         """
@@ -703,7 +1159,7 @@ class ParameterizedXLS(XLRDReader):
         # parameter
         parameter_name = self.parameters['parameter']['name']
         parameter_units = str(self.parameters['parameter']['units'])
-        data[parameter_name] *= UREG(parameter_units)
+        data[parameter_name] *= _unit(parameter_units)
         # data
         self.parameters.pop('parameter')
         return super(ParameterizedXLS, self).apply_units_to_cache(data)
@@ -772,35 +1228,53 @@ class MixedTextXLS(XLRDReader):
     squeezed out. For example scalars will become 0-d arrays.
     """
 
-    def load_data(self, filename, *args, **kwargs):
-        """
-        Load text data from different sheets.
-        """
-        # load text data
-        data = super(MixedTextXLS, self).load_data(filename)
+    def __init__(self, parameters, meta=None):
+        super(MixedTextXLS, self).__init__(parameters, meta)
+        #: plan of (parameter, method name, pattern, compiled regex method,
+        #: units) built once and replayed each time data is loaded
+        self.re_plan = []
         # iterate through sheets in parameters
         for sheet_params in self.parameters.values():
             # iterate through the parameters on each sheet
             for param, pval in sheet_params.items():
-                pattern = pval.get('pattern', EFG_PATTERN)  # get pattern
                 re_meth = pval.get('method', 'search')  # get re method
                 # whitelist re methods, getattr could be considered harmful
-                if re_meth in RE_METH:
-                    re_meth = getattr(re, pval.get('method', 'search'))
+                if re_meth not in RE_METH:
+                    raise AttributeError(RE_METH_MSG)
+                pattern = pval.get('pattern', EFG_PATTERN)
+                # split on literal characters without regex, _EG_: "[,;]"
+                chars = _trivial_split_chars(pattern)
+                if re_meth == 'split' and chars:
+                    re_func = _split_chars(chars)
                 else:
-                    msg = 'Only', '"%s", ' * len(RE_METH) % tuple(RE_METH)
-                    msg += 'regex methods are allowed.'
-                    raise AttributeError(msg)
-                # if not isinstance(data[param], basestring):
-                #     re_meth = lambda p, dp: [re_meth(p, d) for d in dp]
-                match = re_meth(pattern, data[param])  # get matches
-                if match:
-                    try:
-                        match = match.groups()
-                    except AttributeError:
-                        match = [m.groups() for m in match]
-                    npdata = np.array(match, dtype=float).squeeze()
-                    data[param] = npdata * UREG(str(pval.get('units') or ''))
-                else:
-                    raise MixedTextNoMatchError(re_meth, pattern, data[param])
-        return data
+                    # compile pattern once and bind the method to it
+                    re_func = getattr(_get_compiled(pattern), re_meth)
+                # resolve units once, None is dimensionless
+                units = _unit(str(pval.get('units') or ''))
+                self.re_plan.append((param, re_meth, pattern, re_func, units))
+
+    def load_data(self, filename, *args, **kwargs):
+        """
+        Load text data from different sheets.
+        """
+        # load text data
+        data = super(MixedTextXLS, self).load_data(filename)
+        # iterate through the parameters on all sheets
+        for param, re_meth, pattern, re_func, units in self.re_plan:
+            match = re_func(data[param])  # get matches
+            if not match:
+                raise MixedTextNoMatchError(re_meth, pattern, data[param])
+            # search and match return a match object, but findall and split
+            # already return a list of strings, or of tuples if the pattern
+            # has more than one group
+            if re_meth in ('search', 'match'):
+                match = match.groups()
+            # fill the array directly instead of letting NumPy infer shape
+            if match and isinstance(match[0], tuple):
+                npdata = np.empty((len(match), len(match[0])))
+                for n, groups in enumerate(match):
+                    npdata[n] = groups
+            else:
+                npdata = np.fromiter(match, dtype=np.float64, count=len(match))
+            data[param] = _quantity(npdata.squeeze(), units)
+        return self._magnitudes(data)
@@ -17,17 +17,22 @@ for data sources are as follows:
 from simkit.core import (
     UREG, Registry, SimKitJSONEncoder, CommonBase, Parameter
 )
-from simkit.core.data_readers import JSONReader
+from simkit.core.data_readers import JSONReader, _file_hash
 from simkit.core.exceptions import (
     UncertaintyPercentUnitsError, UncertaintyVarianceError
 )
 import json
 import os
+import sys
 import time
 from copy import copy
 import numpy as np
 
 DFLT_UNC = 1.0 * UREG('percent')  # default uncertainty
+PERCENT = DFLT_UNC.units  # uncertainty units
+# error message if isconstant isn't boolean
+_ISCONSTANT_ERR = ('%s meta "isconstant" should be boolean, but it was "%s" '
+                   'for "%s".')
 
 
 class DataParameter(Parameter):
@@ -80,29 +85,34 @@ class DataRegistry(Registry):
         isconstant = kwargs['isconstant']
         # check uncertainty is percent
         if uncertainty:
-            for k0, d in uncertainty.items():
-                for k1, v01 in d.items():
-                    units = v01.units
-                    if units != UREG('percent'):
-                        keys = '%s-%s' % (k0, k1)
-                        raise UncertaintyPercentUnitsError(keys, units)
+            # find the 1st uncertainty that isn't percent, if any
+            bad = next(((k0, k1, v01.units) for k0, d in uncertainty.items()
+                        for k1, v01 in d.items() if v01.units != PERCENT), None)
+            if bad:
+                k0, k1, units = bad
+                keys = '%s-%s' % (k0, k1)
+                raise UncertaintyPercentUnitsError(keys, units)
         # check variance is square of uncertainty
         if variance and uncertainty:
             for k0, d in variance.items():
+                unc0 = uncertainty.get(k0, {})
                 for k1, v01 in d.items():
-                    keys = '%s-%s' % (k0, k1)
-                    missing = k1 not in uncertainty[k0]
-                    v2 = np.asarray(uncertainty[k0][k1].to('fraction').m) ** 2.0
-                    if missing or not np.allclose(np.asarray(v01), v2):
+                    u01 = unc0.get(k1)
+                    # only convert uncertainty if it exists, allclose takes
+                    # scalars or arrays
+                    if (u01 is None or
+                            not np.allclose(v01, u01.to('fraction').m ** 2.0)):
+                        keys = '%s-%s' % (k0, k1)
                         raise UncertaintyVarianceError(keys, v01)
         # check that isconstant is boolean
         if isconstant:
-            for k, v in isconstant.items():
-                if not isinstance(v, bool):
-                    classname = self.__class__.__name__
-                    error_msg = ['%s meta "isconstant" should be' % classname,
-                                 'boolean, but it was "%s" for "%s".' % (v, k)]
-                    raise TypeError(' '.join(error_msg))
+            # bool can't be subclassed, so just compare types
+            bad = next(((k, v) for k, v in isconstant.items()
+                        if type(v) is not bool), None)
+            if bad:
+                k, v = bad
+                classname = self.__class__.__name__
+                raise TypeError(_ISCONSTANT_ERR % (classname, v, k))
         # call super method, meta must be passed as kwargs!
         super(DataRegistry, self).register(newdata, **kwargs)
 
@@ -116,9 +126,13 @@ class DataSourceBase(CommonBase):
     _param_cls = DataParameter
     _reader_attr = 'data_reader'
     _enable_cache_attr = 'data_cache_enabled'
-    _attr_default = {_reader_attr: JSONReader, _enable_cache_attr: True}
+    _keep_raw_attr = 'data_keep_raw'
+    _attr_default = {_reader_attr: JSONReader, _enable_cache_attr: True,
+                     _keep_raw_attr: True}
 
     def __new__(mcs, name, bases, attr):
+        # class name used as data source of all data, only look it up once
+        attr['_clsname'] = sys.intern(name)
         # use only with DataSource subclasses
         if not CommonBase.get_parents(bases, DataSourceBase):
             return super(DataSourceBase, mcs).__new__(mcs, name, bases, attr)
@@ -162,7 +176,6 @@ class DataSource(metaclass=DataSourceBase):
         self.kwargs = kwargs  #: keyword arguments
         # make pycharm by defining inferred objects
         meta = getattr(self, DataSourceBase._meta_attr)
-        parameters = getattr(self, DataSourceBase._param_attr)
         # check if the data reader is a file reader
         filename = None
         if meta.data_reader.is_file_reader:
@@ -182,17 +195,19 @@ class DataSource(metaclass=DataSourceBase):
         # If data caching enabled and file doesn't end with ".json", cache it as
         # JSON, append ".json" to the original filename and pass original data
         # reader as extra argument.
-        if meta.data_cache_enabled and self._is_cached():
-            # switch reader to JSONReader, with old reader as extra arg
-            data_reader_instance = JSONReader(parameters, meta)
-        else:
-            # create the data reader object specified using parameter map
-            data_reader_instance = meta.data_reader(parameters, meta)
+        # only file readers can be cached, so skip checking for the cache
+        # otherwise
+        cache_enabled = meta.data_cache_enabled and filename is not None
+        is_cached = cache_enabled and self._is_cached()
+        # switch reader to JSONReader if cached, with old reader in meta,
+        # otherwise use the data reader specified using parameter map
+        data_reader_instance = self._get_data_reader(is_cached)
         #: data loaded from reader
         self.data = data_reader_instance.load_data(*args, **kwargs)
         # save JSON file if doesn't exist already. JSONReader checks utc mod
-        # time vs orig file, and deletes JSON file if orig file is newer.
-        if meta.data_cache_enabled and not self._is_cached():
+        # time vs orig file, and deletes JSON file if orig file is newer, so
+        # only check again if it was cached before loading
+        if cache_enabled and not (is_cached and self._is_cached()):
             self.saveas_json(self.filename)  # ".json" appended by saveas_json
         # XXX: default values of uncertainty, isconstant and timeseries are
         # empty dictionaries.
@@ -205,7 +220,7 @@ class DataSource(metaclass=DataSourceBase):
         #: name of corresponding time series data, ``None`` if no time series
         self.timeseries = {}
         #: name of :class:`DataSource`
-        self.data_source = dict.fromkeys(self.data, self.__class__.__name__)
+        self.data_source = dict.fromkeys(self.data, self._clsname)
         # TODO: need a consistent way to handle uncertainty, isconstant and time
         # series
         # XXX: Each superclass should do the following:
@@ -214,12 +229,47 @@ class DataSource(metaclass=DataSourceBase):
         #   data validation, combining years, months, days and hours into
         #   datetime objects and parsing data from strings.
         # * handle uncertainty, isconstant, timeseries and any other meta data.
-        self._raw_data = copy(self.data)  # shallow copy of data
+        # only copy the raw data if __prepare_data__ might change it in place
+        if meta.data_keep_raw:
+            self._raw_data = copy(self.data)  # shallow copy of data
+        else:
+            self._raw_data = self.data
         self.__prepare_data__()  # prepare data for registry
-        # calculate variances
+        # calculate variances, keep every covariance of each key
         for k0, d in self.uncertainty.items():
-            for k1, v01 in d.items():
-                self.variance[k0] = {k1: v01.to('fraction').m ** 2.0}
+            self.variance[k0] = {
+                k1: v01.to('fraction').m ** 2.0 for k1, v01 in d.items()
+            }
+
+    @classmethod
+    def _get_data_reader(cls, is_cached=False):
+        """
+        Get a new data reader for this data source. Readers only depend on the
+        class parameters and meta, so the reader class and its arguments are
+        only looked up once per class. Readers keep state, _EG_: units of the
+        data they loaded, so a new reader is created for each data source.
+
+        :param is_cached: get :class:`~simkit.core.data_readers.JSONReader`
+            to read cached data instead of the original reader
+        :type is_cached: bool
+        :return: data reader
+        :rtype: :class:`~simkit.core.data_readers.DataReader`
+        """
+        # look in this class only, subclasses have different parameters
+        data_readers = cls.__dict__.get('_data_readers')
+        if data_readers is None:
+            data_readers = {}
+            cls._data_readers = data_readers
+        reader_args = data_readers.get(is_cached)
+        if reader_args is None:
+            meta = getattr(cls, DataSourceBase._meta_attr)
+            parameters = getattr(cls, DataSourceBase._param_attr)
+            reader_cls = JSONReader if is_cached else meta.data_reader
+            reader_args = data_readers[is_cached] = (
+                reader_cls, parameters, meta
+            )
+        reader_cls, parameters, meta = reader_args
+        return reader_cls(parameters, meta)
 
     def __prepare_data__(self):
         """
@@ -259,8 +309,9 @@ class DataSource(metaclass=DataSourceBase):
 
     def saveas_json(self, save_name):
         """
-        Save :attr:`data`, :attr:`param_file`, original :attr:`data_reader`
-        and UTC modification time as keys in JSON file. If data is edited then
+        Save :attr:`data`, :attr:`param_file`, original :attr:`data_reader`,
+        UTC modification time, modification time in nanoseconds, size and
+        content hash of the original file as keys in JSON file. If data is edited then
         it should be saved using this method. Non-JSON data files are also
         saved using this method.
 
@@ -271,9 +322,14 @@ class DataSource(metaclass=DataSourceBase):
         meta = getattr(self, DataSourceBase._meta_attr)
         param_file = getattr(self, DataSourceBase._param_file)
         # JSONEncoder removes units and converts arrays to lists
-        # save last time file was modified
-        utc_mod_time = list(time.gmtime(os.path.getmtime(save_name)))
+        # save last time file was modified and its size, stat file once
+        orig_stat = os.stat(save_name)
+        # tuple slice of struct_time, json writes it as an array anyway
+        utc_mod_time = time.gmtime(orig_stat.st_mtime)[:9]
         json_data = {'data': self.data, 'utc_mod_time': utc_mod_time,
+                     'orig_size': orig_stat.st_size,
+                     'orig_mtime_ns': orig_stat.st_mtime_ns,
+                     'content_hash': _file_hash(save_name),
                      'param_file': param_file,
                      'data_reader': meta.data_reader.__name__,
                      'data_source': self.__class__.__name__}
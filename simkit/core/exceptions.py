@@ -6,8 +6,11 @@ Exceptions for SimKit.
 
 class SimKitException(Exception):
     """
-    Base exception class for SimKit.
+    Base exception class for SimKit. Subclasses implement ``message`` as a
+    property so it's only formatted if the exception is shown.
     """
+    __slots__ = ()
+
     def __str__(self):
         return self.message
 
@@ -19,9 +22,14 @@ class UnnamedDataError(SimKitException):
     :param filename: The name of the file from which the data was loaded.
     :type filename: str
     """
+    __slots__ = ('filename',)
+
     def __init__(self, filename):
         self.filename = filename
-        self.message = 'Data read from "%s" without names.' % self.filename
+
+    @property
+    def message(self):
+        return 'Data read from "%s" without names.' % self.filename
 
 
 class DuplicateRegItemError(SimKitException):
@@ -31,10 +39,15 @@ class DuplicateRegItemError(SimKitException):
     :param keys: Keys of the duplicate data.
     :type keys: set
     """
+    __slots__ = ('duplicate_keys',)
+
     def __init__(self, keys):
         self.duplicate_keys = keys
-        self.message = ('Duplicate data can\'t be registered:\n\t%s' %
-                        '\n\t'.join(self.duplicate_keys))
+
+    @property
+    def message(self):
+        return ('Duplicate data can\'t be registered:\n\t%s' %
+                '\n\t'.join(self.duplicate_keys))
 
 
 class MismatchRegMetaKeysError(SimKitException):
@@ -44,10 +57,15 @@ class MismatchRegMetaKeysError(SimKitException):
     :param keys: Keys of the mismatched meta.
     :type keys: set
     """
+    __slots__ = ('mismatch_keys',)
+
     def __init__(self, keys):
         self.mismatch_keys = keys
-        self.message = ('Meta must be a subset of registry:\n\t%s' %
-                        '\n\t'.join(self.mismatch_keys))
+
+    @property
+    def message(self):
+        return ('Meta must be a subset of registry:\n\t%s' %
+                '\n\t'.join(self.mismatch_keys))
 
 
 class UncertaintyPercentUnitsError(SimKitException):
@@ -59,10 +77,15 @@ class UncertaintyPercentUnitsError(SimKitException):
     :param units: Units of the uncertainty key that doesn't have percent units.
     :type units: str
     """
+    __slots__ = ('data_key', 'units')
+
     def __init__(self, key, units):
         self.data_key = key
         self.units = units
-        self.message = (
+
+    @property
+    def message(self):
+        return (
             'Uncertainty can only have units of percent (%%), but "%s" ' +
             'has units of "%s" instead.'
         ) % (self.data_key, self.units)
@@ -77,10 +100,15 @@ class UncertaintyVarianceError(SimKitException):
     :param value: Value of the uncertainty key that doesn't match variance.
     :type value: float
     """
+    __slots__ = ('data_key', 'value')
+
     def __init__(self, key, value):
         self.data_key = key
         self.value = value
-        self.message = (
+
+    @property
+    def message(self):
+        return (
             'Variance must be square of uncertainty, but "%s" ' +
             'equals "%g" instead.'
         ) % (self.data_key, self.value)
@@ -99,11 +127,16 @@ class UncertaintyBoundsUnitsError(SimKitException):
     :param up_units: Units of upper uncertainty bound
     :type up_units: :mod:`quantities`
     """
+    __slots__ = ('data_key', 'lo_units', 'up_units')
+
     def __init__(self, key, lo_units, up_units):
         self.data_key = key
         self.lo_units = lo_units.dimensionality
         self.up_units = up_units.dimensionality
-        self.message = (
+
+    @property
+    def message(self):
+        return (
             'Uncertainty lower and upper bounds must both have units of ' +
             'percent (%%), but "%s" has units of "%s" for the lower bound ' +
             'and "%s" for the upper bound.'
@@ -114,28 +147,43 @@ class CircularDependencyError(SimKitException):
     """
     Topological sort cyclic error.
     """
+    __slots__ = ('calc',)
+
     def __init__(self, keys):
         self.calc = keys
-        self.message = 'Not a DAG. Cyclic keys:\n\t%s' % '\n\t'.join(self.calc)
+
+    @property
+    def message(self):
+        return 'Not a DAG. Cyclic keys:\n\t%s' % '\n\t'.join(self.calc)
 
 
 class MixedTextNoMatchError(SimKitException):
     """
     No match in mixed text data source error.
     """
+    __slots__ = ('re_meth', 'pattern', 'data')
+
     def __init__(self, re_meth, pattern, data):
         self.re_meth = re_meth
         self.pattern = pattern
         self.data = data
-        self.message = ('No match using regex "%s" with "%s" in "%s".' %
-                        (self.re_meth, self.pattern, self.data))
+
+    @property
+    def message(self):
+        return ('No match using regex "%s" with "%s" in "%s".' %
+                (self.re_meth, self.pattern, self.data))
 
 
 class MissingDataError(SimKitException):
     """
     Data is missing or incomplete.
     """
+    __slots__ = ('data_srcs',)
+
     def __init__(self, data_srcs):
         self.data_srcs = data_srcs
-        self.message = ('Data is missing for the following data sources:\n%r' %
-                        list(self.data_srcs))
+
+    @property
+    def message(self):
+        return ('Data is missing for the following data sources:\n%r' %
+                list(self.data_srcs))
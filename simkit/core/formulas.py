@@ -8,38 +8,167 @@ formula importer, or can subclass one of the formula importers here.
 
 from past.builtins import basestring
 from simkit.core import logging, CommonBase, Registry, UREG, Parameter
-import imp
 import importlib
+import importlib.util
+import functools
 import os
 import sys
 import numexpr as ne
+import numpy as np
 import inspect
 from uncertainty_wrapper import unc_wrapper_args
 
 LOGGER = logging.getLogger(__name__)
+#: formulas wrapped to propagate uncertainty keyed by formula and arg numbers
+_UNC_WRAPPED = {}
+#: compiled numerical expressions keyed by expression and arguments
+_NE_CACHE = {}
+#: units of covariance and Jacobian appended to units of returns
+_PAD = (None, None)
 
 
 def units_wrapper(ret, args):
     if isinstance(ret, basestring):
         ret = [ret]
     def wrapped_func(f):
+        units = []  # units of returns and args, parsed once on first call
         def wrapper(*params, **kw):
+            if not units:
+                units.append((
+                    [UREG(r) for r in ret],
+                    [None if a is None else UREG(a) for a in args]
+                ))
+            ret_units, arg_units = units[0]
             vals = []
-            for p, a in zip(params, args):
+            for p, a in zip(params, arg_units):
                 if a is None:
                     vals.append(p)
                     LOGGER.info('Skipping param with no units')
                     continue
-                vals.append(p.to(UREG(a)).magnitude)
+                vals.append(p.to(a).magnitude)
             LOGGER.info('hey I am inside the wrapper!')
             LOGGER.debug(f)
             LOGGER.debug(ret)
             LOGGER.debug(args)
-            return [rv*UREG(r) for rv, r in zip(f(*vals, **kw), ret)]
+            return [rv*r for rv, r in zip(f(*vals, **kw), ret_units)]
         return wrapper
     return wrapped_func 
 
 
+def _cached_import(name, module, package=None):
+    """
+    Import module, or get it from :data:`sys.modules` if already imported.
+
+    :param name: full dotted name of module
+    :param module: name of module, relative if package is given
+    :param package: package of module, default is ``None``
+    :returns: module
+    """
+    mod = sys.modules.get(name)
+    if mod is None:
+        mod = importlib.import_module(module, package)
+    return mod
+
+
+def _import_from_path(name, path):
+    """
+    Import module from its file in path. Hierarchical module names are nested
+    folders in path, and parent packages are imported first, so the module
+    is an attribute of its parent and relative imports work.
+
+    :param name: full dotted name of module
+    :param path: folder containing the top level package or module
+    :returns: module or ``None`` if its file isn't found
+    """
+    parent, _, child = name.rpartition('.')
+    parent_mod = None
+    if parent:
+        parent_mod = sys.modules.get(parent)
+        if parent_mod is None:
+            parent_mod = _import_from_path(parent, path)
+            if parent_mod is None:
+                return None
+    # a package is loaded from its "__init__.py" and searched for submodules
+    filename = os.path.join(path, *name.split('.'))
+    if os.path.isdir(filename):
+        locations = [filename]
+        filename = os.path.join(filename, '__init__.py')
+        if not os.path.exists(filename):
+            # folder without "__init__.py" is a namespace package
+            spec = importlib.util.spec_from_loader(name, None, is_package=True)
+            spec.submodule_search_locations = locations
+            filename = None
+    else:
+        locations = None
+        filename += '.py'
+        if not os.path.exists(filename):
+            return None
+    LOGGER.debug('module name: %s, file: %s', name, filename)
+    # load module directly from its file, one spec per module
+    # SEE ALSO: https://docs.python.org/3/library/importlib.html
+    if filename:
+        spec = importlib.util.spec_from_file_location(
+            name, filename, submodule_search_locations=locations
+        )
+        if spec is None:
+            return None
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    if filename:
+        try:
+            spec.loader.exec_module(mod)
+        except BaseException:
+            # don't leave a partially loaded module in sys.modules
+            del sys.modules[name]
+            raise
+    if parent_mod is not None:
+        setattr(parent_mod, child, mod)
+    return mod
+
+
+@functools.lru_cache(maxsize=None)
+def _argspec_args(fn):
+    """
+    Get names of positional arguments of a function, memoized by function.
+
+    :param fn: function
+    :returns: names of positional arguments
+    :rtype: tuple
+    """
+    return tuple(inspect.getfullargspec(fn).args)
+
+
+def _get_formulas(mod, formula_param):
+    """
+    Get formulas from module by names, or keys if parameters are a dictionary.
+    """
+    # FYI: iterating over dictionary is equivalent to iterkeys()
+    return {f: getattr(mod, f) for f in formula_param}
+
+
+def _get_formula(mod, formula_param):
+    """
+    Get only one formula from module by name.
+    """
+    return {formula_param: getattr(mod, formula_param)}
+
+
+def _autodetect_formulas(mod, formula_param=None):
+    """
+    Autodetect formulas in module assuming names start with "f_".
+    """
+    # module namespace directly, no need to sort names or get each attribute
+    return {f: v for f, v in vars(mod).items()
+            if f.startswith('f_') and callable(v)}
+
+
+#: how to get formulas from a module by type of formula parameters
+_FORMULA_PARAM_HANDLERS = {
+    dict: _get_formulas, list: _get_formulas, tuple: _get_formulas,
+    str: _get_formula
+}
+
+
 class FormulaParameter(Parameter):
     """
     Field for data parameters.
@@ -65,6 +194,9 @@ class FormulaRegistry(Registry):
 
         :param new_formulas: new formulas to add to registry.
         """
+        # nothing to register, eg: formula source without any formulas
+        if not new_formulas:
+            return
         kwargs.update(zip(self.meta_names, args))
         # call super method, meta must be passed as kwargs!
         super(FormulaRegistry, self).register(new_formulas, **kwargs)
@@ -117,73 +249,37 @@ class PyModuleImporter(FormulaImporter):
         path = getattr(self.meta, 'path', None)  # path read from parameters
         # import module using module and package
         mod = None
-        # SEE ALSO: http://docs.python.org/2/library/imp.html#examples
         try:
-            # fast path: see if module was already imported
-            mod = sys.modules[name]
-        except KeyError:
-            try:
-                # import module specified in parameters
-                mod = importlib.import_module(module, package)
-            except ImportError as err:
-                if not path:
-                    msg = ('%s could not be imported either because it was not '
-                           'on the PYTHONPATH or path was not given.')
-                    LOGGER.exception(msg, name)
+            # import module specified in parameters, fast path if module
+            # was already imported
+            mod = _cached_import(name, module, package)
+        except ImportError as err:
+            if not path:
+                msg = ('%s could not be imported either because it was not '
+                       'on the PYTHONPATH or path was not given.')
+                LOGGER.exception(msg, name)
+                raise err
+            else:
+                # import module using path
+                # expand ~, environmental variables and make path absolute
+                if not os.path.isabs(path):
+                    path = os.path.expanduser(os.path.expandvars(path))
+                    path = os.path.abspath(path)
+                mod = _import_from_path(name, path)
+                if mod is None:
                     raise err
-                else:
-                    # import module using path
-                    # expand ~, environmental variables and make path absolute
-                    if not os.path.isabs(path):
-                        path = os.path.expanduser(os.path.expandvars(path))
-                        path = os.path.abspath(path)
-                    # paths must be a list
-                    paths = [path]
-                    # imp does not find hierarchical module names, find and load
-                    # packages recursively, then load module, see last paragraph
-                    # https://docs.python.org/2/library/imp.html#imp.find_module
-                    pname = ''  # full dotted name of package to load
-                    # traverse namespace
-                    while name:
-                        # if dot in name get first package
-                        if '.' in name:
-                            pkg, name = name.split('.', 1)
-                        else:
-                            pkg, name = name, None  # pkg is the module
-                        # Find package or module by name and path
-                        fp, filename, desc = imp.find_module(pkg, paths)
-                        # full dotted name of package to load
-                        pname = pkg if not pname else '%s.%s' % (pname, pkg)
-                        LOGGER.debug('package name: %s', pname)
-                        # try to load the package or module
-                        try:
-                            mod = imp.load_module(pname, fp, filename, desc)
-                        finally:
-                            if fp:
-                                fp.close()
-                        # append package paths for imp.find_module
-                        if name:
-                            paths = mod.__path__
-        formulas = {}  # an empty list of formulas
         formula_param = self.parameters  # formulas key
-        # FYI: iterating over dictionary is equivalent to iterkeys()
-        if isinstance(formula_param, (list, tuple, dict)):
-            # iterate through formulas
-            for f in formula_param:
-                formulas[f] = getattr(mod, f)
-        elif isinstance(formula_param, basestring):
-            # only one formula
-            # FYI: use basestring to test for str and unicode
-            # SEE: http://docs.python.org/2/library/functions.html#basestring
-            formulas[formula_param] = getattr(mod, formula_param)
-        else:
-            # autodetect formulas assuming first letter is f
-            formulas = {f: getattr(mod, f) for f in dir(mod) if f[:2] == 'f_'}
+        # look up how to get formulas by type of parameters, or the nearest
+        # base type for subclasses, otherwise autodetect formulas
+        handler = _autodetect_formulas
+        for cls in type(formula_param).__mro__:
+            if cls in _FORMULA_PARAM_HANDLERS:
+                handler = _FORMULA_PARAM_HANDLERS[cls]
+                break
+        formulas = handler(mod, formula_param)
         if not len(formulas):
-            for f in dir(mod):
-                mod_attr = getattr(mod, f)
-                if inspect.isfunction(mod_attr):
-                    formulas[f] = mod_attr
+            formulas = {f: v for f, v in vars(mod).items()
+                        if inspect.isfunction(v)}
         return formulas
 
 
@@ -195,13 +291,32 @@ class NumericalExpressionImporter(FormulaImporter):
         formulas = {}  # an empty list of formulas
         formula_param = self.parameters  # formulas key
         for f, p in formula_param.items():
-            formulas[f] = lambda *args: ne.evaluate(
-                p['extras']['expression'],
-                {k: a for k, a in zip(p['args'], args)}, {}
-            ).reshape(1, -1)
+            # parse and compile each expression once, all args are doubles,
+            # and share it with any formula with the same expression and args
+            key = (p['extras']['expression'], tuple(p['args']))
+            compiled = _NE_CACHE.get(key)
+            if compiled is None:
+                signature = [(a, np.double) for a in key[1]]
+                compiled = _NE_CACHE[key] = ne.NumExpr(key[0], signature)
+            formulas[f] = self._numexpr_formula(compiled)
             LOGGER.debug('formulas %s = %r', f, formulas[f])
         return formulas
 
+    @staticmethod
+    def _numexpr_formula(compiled):
+        """
+        Make a formula from a compiled numerical expression.
+
+        :param compiled: compiled numerical expression
+        :type compiled: :class:`numexpr.NumExpr`
+        :returns: formula that evaluates the expression with positional args
+        """
+        def formula(*args):
+            # compiled expressions only accept arrays of the signature type
+            args = [np.asarray(a, dtype=np.double) for a in args]
+            return compiled(*args).reshape(1, -1)
+        return formula
+
 
 class FormulaBase(CommonBase):
     """
@@ -241,21 +356,22 @@ class Formula(metaclass=FormulaBase):
     __metaclass__ = FormulaBase
 
     def __init__(self):
+        meta = self._meta  # options for formulas
+        formula_param = self.parameters  # formulas key
         # check for path listed in param file
-        path = getattr(self._meta, 'path', None)
+        path = getattr(meta, 'path', None)
         if path is None:
             proxy_file = self.param_file if self.param_file else __file__
             # use the same path as the param file or this file if no param file
-            self._meta.path = os.path.dirname(proxy_file)
+            meta.path = os.path.dirname(proxy_file)
 
         # check for path listed in param file
-        formula_importer = getattr(self._meta, 'formula_importer', None)
+        formula_importer = getattr(meta, 'formula_importer', None)
         if formula_importer is None:
             #: formula importer class, default is ``PyModuleImporter``
-            self._meta.formula_importer = PyModuleImporter
+            formula_importer = meta.formula_importer = PyModuleImporter
 
-        meta = getattr(self, '_meta', None)  # options for formulas
-        importer_instance = self._meta.formula_importer(self.parameters, meta)
+        importer_instance = formula_importer(formula_param, meta)
         #: formulas loaded by the importer using specified parameters
         self.formulas = importer_instance.import_formulas()
         #: linearity determined by each data source?
@@ -266,58 +382,60 @@ class Formula(metaclass=FormulaBase):
         self.units = {}
         #: constant arguments that are not included in covariance calculation
         self.isconstant = {}
-        # sequence of formulas, don't propagate uncertainty or units
-        for f in self.formulas:
-            self.islinear[f] = True
-            self.args[f] = inspect.getargspec(self.formulas[f]).args
-        formula_param = self.parameters  # formulas key
-        # if formulas is a list or if it can't be iterated as a dictionary
-        # then log warning and return
-        try:
-            formula_param_generator = formula_param.items()
-        except AttributeError as err:
-            LOGGER.warning('Attribute Error: %s', err.message)
-            return
-        # formula dictionary
-        for k, v in formula_param_generator:
-            if not v:
-                # skip formula if attributes are null or empty
-                continue
-            # get islinear formula attribute
-            is_linear = v.get('islinear')
-            if is_linear is not None:
-                self.islinear[k] = is_linear
-            # get positional arguments
-            f_args = v.get('args')
-            if f_args is not None:
-                self.args[k] = f_args
+        # if formulas is a list or if it can't be looked up as a dictionary
+        # then log warning, and don't propagate uncertainty or units
+        if not hasattr(formula_param, 'get'):
+            LOGGER.warning('Formula parameters are not a mapping: %r',
+                           formula_param)
+            formula_param = {}
+        # bind formula attributes to locals once for the loop
+        formulas, islinear, args = self.formulas, self.islinear, self.args
+        isconstant, units = self.isconstant, self.units
+        # formula dictionary, attributes override defaults in a single pass
+        for k, fn in formulas.items():
+            # null or empty attributes use defaults
+            v = formula_param.get(k) or {}
+            v_get = v.get
+            # get islinear formula attribute, default is linear
+            is_linear = v_get('islinear')
+            islinear[k] = True if is_linear is None else is_linear
+            # get positional arguments, only inspect formula if not given
+            f_args = v_get('args')
+            if f_args is None:
+                # copy, so formulas don't share the memoized arguments
+                f_args = list(_argspec_args(fn))
+            args[k] = f_args
             # get constant arguments to exclude from covariance
-            self.isconstant[k] = v.get('isconstant')
-            if self.isconstant[k] is not None:
-                argn = [n for n, a in enumerate(self.args[k]) if a not in
-                        self.isconstant[k]]
+            f_const = isconstant[k] = v_get('isconstant')
+            # always wrap if isconstant is given, even if it's empty or all
+            # args are constant, because calculators pass the covariance and
+            # expect covariance and Jacobian after the return values
+            if f_const is not None:
+                constants = frozenset(f_const)
+                argn = tuple(n for n, a in enumerate(f_args)
+                             if a not in constants)
                 LOGGER.debug('%s arg nums: %r', k, argn)
-                self.formulas[k] = unc_wrapper_args(*argn)(self.formulas[k])
+                # only wrap each formula once for the same arg numbers
+                key = (fn, argn)
+                fn = _UNC_WRAPPED.get(key)
+                if fn is None:
+                    fn = _UNC_WRAPPED[key] = unc_wrapper_args(*argn)(key[0])
             # get units of returns and arguments
-            self.units[k] = v.get('units')
-            if self.units[k] is not None:
+            f_units = units[k] = v_get('units')
+            if f_units is not None:
                 # append units for covariance and Jacobian if all args
                 # constant and more than one return output
-                if self.isconstant[k] is not None:
+                if f_const is not None:
                     # check if retval units is a string or None before adding
                     # extra units for Jacobian and covariance
-                    ret_units = self.units[k][0]
+                    ret_units = f_units[0]
                     if isinstance(ret_units, basestring) or ret_units is None:
-                        self.units[k][0] = [ret_units]
-                    try:
-                        self.units[k][0] += [None, None]
-                    except TypeError:
-                        self.units[k][0] += (None, None)
+                        ret_units = (ret_units, )
+                    f_units[0] = tuple(ret_units) + _PAD
                 # wrap function with Pint's unit wrapper
-                self.formulas[k] = units_wrapper(*self.units[k])(self.formulas[k])
-                # self.formulas[k] = UREG.wraps(*self.units[k])(
-                #     self.formulas[k]
-                # )
+                fn = units_wrapper(*f_units)(fn)
+                # fn = UREG.wraps(*f_units)(fn)
+            formulas[k] = fn
 
     def __getitem__(self, item):
         return self.formulas[item]
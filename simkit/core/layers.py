@@ -27,19 +27,132 @@ be implemented in each subclass of
 
 from past.builtins import basestring
 import importlib
+import functools
+import operator
 import os
 from simkit.core import logging, warnings
-from simkit.core.simulations import SimRegistry, Simulation
-from simkit.core.data_sources import DataRegistry, DataSource
-from simkit.core.formulas import FormulaRegistry, Formula
-from simkit.core.calculations import CalcRegistry, Calc
-from simkit.core.outputs import OutputRegistry, Output
+from simkit.core.exceptions import DuplicateRegItemError
+
+__all__ = ('Layer', 'Data', 'Formulas', 'Calculations', 'Outputs',
+           'Simulations')
 
 LOGGER = logging.getLogger(__name__)
 SIMFILE_LOAD_WARNING = ' '.join([
     'Use of "filename" or "path" in model for simulation is deprecated.',
     'This will raise an exception in the future.'
 ])
+LAYER_NAME_ERROR = 'Layer class "%s" should not start with underscores.'
+# registries and sources of each layer are only imported when first used, so
+# importing this module doesn't import every layer and its dependencies
+_LAZY_IMPORTS = {
+    'SimRegistry': 'simkit.core.simulations',
+    'Simulation': 'simkit.core.simulations',
+    'DataRegistry': 'simkit.core.data_sources',
+    'DataSource': 'simkit.core.data_sources',
+    'FormulaRegistry': 'simkit.core.formulas',
+    'Formula': 'simkit.core.formulas',
+    'CalcRegistry': 'simkit.core.calculations',
+    'Calc': 'simkit.core.calculations',
+    'OutputRegistry': 'simkit.core.outputs',
+    'Output': 'simkit.core.outputs'
+}
+
+
+def __getattr__(name):
+    """
+    Import registries and sources of layers on first access.
+
+    :param name: name of registry or source class
+    :returns: registry or source class
+    :raises: :exc:`~exceptions.AttributeError`
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    value = globals()[name] = getattr(importlib.import_module(module), name)
+    return value
+
+
+class _LazyImport(object):
+    """
+    Class attribute that is a registry or source class imported on first
+    access.
+
+    :param name: name of registry or source class in :data:`_LAZY_IMPORTS`
+    """
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        return globals().get(self.name) or __getattr__(self.name)
+
+
+def _check_name(name, err=LAYER_NAME_ERROR):
+    """
+    Check that the name of a layer class doesn't start with underscores.
+
+    :param name: name of layer class
+    :param err: message of the error, formatted only if the check fails
+    :raises: :exc:`~exceptions.AttributeError`
+    """
+    if name[:1] == '_':
+        raise AttributeError(err % name)
+
+
+def _fingerprint(src, rel_path=None):
+    """
+    Get the inputs that determine what is loaded for a source.
+
+    :param src: layer parameters of a source
+    :type src: dict
+    :param rel_path: path that the source path is relative to
+    :returns: relative path and a copy of the layer parameters
+    :rtype: tuple
+    """
+    # copy lists, eg: of filenames, so editing the layer changes fingerprint
+    return rel_path, {k: tuple(v) if isinstance(v, list) else v
+                      for k, v in src.items()}
+
+
+def _meta_getter(meta_names):
+    """
+    Make a function that gets all of the meta attributes of a source instance
+    as a tuple in the same order as the registry meta names.
+
+    :param meta_names: registry meta names
+    :returns: function of source instance that returns tuple of meta
+    """
+    if len(meta_names) > 1:
+        return operator.attrgetter(*meta_names)
+    # attrgetter doesn't return a tuple for only one name, nor take no names
+    return lambda obj: tuple(getattr(obj, m) for m in meta_names)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_import(module, package):
+    """
+    Import module (from package), memoized so each module is only imported
+    once, however many layer classes it contains.
+
+    :param module: Python module that contains layer classes
+    :param package: optional package containing module with layer classes
+    :returns: module
+    """
+    return importlib.import_module(module, package)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_getattr(module, package, name):
+    """
+    Import module (from package) and get a layer class definition from it,
+    memoized so each layer class is only looked up once.
+
+    :param module: Python module that contains layer class
+    :param package: optional package containing module with layer class
+    :param name: name of layer class
+    :returns: layer class
+    """
+    return getattr(_cached_import(module, package), name)
 
 
 class Layer(object):
@@ -49,6 +162,8 @@ class Layer(object):
     :param sources: Dictionary of model parameters specific to this layer.
     :type sources: dict
     """
+    __slots__ = ('layer', 'sources', 'objects', 'reg', '_get_meta',
+                 '_reg_register', '_loaded')
     reg_cls = NotImplemented  #: registry class
     src_cls = NotImplemented  #: source class
 
@@ -61,6 +176,12 @@ class Layer(object):
         self.objects = {}
         #: registry of items contained in this layer
         self.reg = self.reg_cls()
+        # get meta of source instances in order of registry meta names
+        self._get_meta = _meta_getter(self.reg.meta_names)
+        # bound register method of the registry
+        self._reg_register = self.reg.register
+        # fingerprints of sources already loaded from the layer
+        self._loaded = {}
 
     def add(self, src_cls, module, package=None):
         """
@@ -72,12 +193,96 @@ class Layer(object):
         :type module: str
         :param package: optional package containing module with layer class
         :type package: str
-        :raises: :exc:`~exceptions.NotImplementedError`
+        :raises: :exc:`~exceptions.AttributeError`
+        """
+        _check_name(src_cls)
+        # import module containing the layer class and get layer class
+        # definition from the module, only once for each layer class
+        self.sources[src_cls] = _cached_getattr(module, package, src_cls)
+
+    def _load_add(self, layer_cls):
+        """
+        Get method to add sources loaded from :attr:`layer`. Their layer info
+        is already in :attr:`layer`, so only their classes are imported,
+        unless a subclass of ``layer_cls`` overloads :meth:`add`.
+
+        :param layer_cls: layer class with the default :meth:`add`
+        :returns: method with the same arguments as :meth:`add`
         """
-        # import module containing the layer class
-        mod = importlib.import_module(module, package)
-        # get layer class definition from the module
-        self.sources[src_cls] = getattr(mod, src_cls)
+        if type(self).add is layer_cls.add:
+            return functools.partial(Layer.add, self)
+        return self.add
+
+    def _add_source(self, src_cls, module, package=None):
+        """
+        Add layer class to model and copy its parameters to :attr:`layer` if
+        they're missing.
+        """
+        # always import with the base method, subclasses overload add
+        Layer.add(self, src_cls, module, package)
+        # only update layer info if it is missing!
+        if src_cls not in self.layer:
+            # copy source parameters to :attr:`Layer.layer`
+            self.layer[src_cls] = {'module': module, 'package': package}
+
+    def _pending(self, rel_path=None):
+        """
+        Get sources in :attr:`layer` that haven't been loaded yet, or whose
+        layer parameters or relative path changed since they were loaded, so
+        loading again doesn't read or register the same sources twice.
+
+        :param rel_path: path that source paths are relative to
+        :returns: names and layer parameters of sources to load
+        :rtype: list
+        """
+        loaded = self._loaded
+        return [(k, v) for k, v in self.layer.items()
+                if loaded.get(k) != _fingerprint(v, rel_path)]
+
+    def _unload_changed(self, pending, payload_attr):
+        """
+        Unregister items of pending sources that were already loaded, because
+        their inputs changed, so they can be loaded again.
+
+        :param pending: names and layer parameters of sources to load
+        :param payload_attr: attribute of source instances with items
+        """
+        for k, _ in pending:
+            src_obj = self.objects.get(k) if k in self._loaded else None
+            if src_obj is not None:
+                self.reg.unregister(list(getattr(src_obj, payload_attr)))
+
+    def _set_loaded(self, srcs, rel_path=None):
+        """
+        Record fingerprints of loaded sources.
+
+        :param srcs: names and layer parameters of loaded sources
+        :param rel_path: path that source paths are relative to
+        """
+        self._loaded.update((k, _fingerprint(v, rel_path)) for k, v in srcs)
+
+    def _register_all(self, src_objs, payload_attr):
+        """
+        Register items and meta from several source instances with a single
+        call to the registry.
+
+        :param src_objs: source instances in the order they're registered
+        :param payload_attr: attribute of source instances with items
+        :raises: :exc:`~simkit.core.exceptions.DuplicateRegItemError`
+        """
+        items = {}
+        meta = [{} for _ in self.reg.meta_names]
+        for src_obj in src_objs:
+            new_items = getattr(src_obj, payload_attr)
+            # items can't override items from other sources either
+            duplicates = items.keys() & new_items.keys()
+            if duplicates:
+                raise DuplicateRegItemError(duplicates)
+            items.update(new_items)
+            for merged, new_meta in zip(meta, self._get_meta(src_obj)):
+                if new_meta:
+                    merged.update(new_meta)
+        self._reg_register(items, *meta)
 
     def load(self, relpath=None):
         """
@@ -120,8 +325,9 @@ class Data(Layer):
     data file. If the path is ``None``, then the default path for data internal
     to SimKit is used. External data files should specify the path.
     """
-    reg_cls = DataRegistry  #: data layer registry
-    src_cls = DataSource  #: data layer source
+    __slots__ = ()
+    reg_cls = _LazyImport('DataRegistry')  #: data layer registry
+    src_cls = _LazyImport('DataSource')  #: data layer source
 
     def add(self, data_source, module, package=None):
         """
@@ -139,11 +345,7 @@ class Data(Layer):
         .. seealso::
             :func:`importlib.import_module`
         """
-        super(Data, self).add(data_source, module, package)
-        # only update layer info if it is missing!
-        if data_source not in self.layer:
-            # copy data source parameters to :attr:`Layer.layer`
-            self.layer[data_source] = {'module': module, 'package': package}
+        self._add_source(data_source, module, package)
         # add a place holder for the data source object when it's constructed
         self.objects[data_source] = None
 
@@ -158,7 +360,18 @@ class Data(Layer):
         the data source or the full path of the file which contains data for the
         data source.
         """
-        if self.sources[data_source]._meta.data_reader.is_file_reader:
+        data_src_obj = self._open(data_source, *args, **kwargs)
+        # register data and uncertainty in registry
+        self._reg_register(data_src_obj.data, *self._get_meta(data_src_obj))
+
+    def _open(self, data_source, *args, **kwargs):
+        """
+        Open filename to get data for data_source without registering it.
+
+        :returns: data source instance
+        """
+        data_src_cls = self.sources[data_source]
+        if data_src_cls._meta.data_reader.is_file_reader:
             filename = kwargs.get('filename')
             path = kwargs.get('path', '')
             rel_path = kwargs.get('rel_path', '')
@@ -172,34 +385,46 @@ class Data(Layer):
             kwargs = {'filename': os.path.join(rel_path, path, filename)}
             LOGGER.debug('filename: %s', kwargs['filename'])
         # call constructor of data source with filename argument
-        self.objects[data_source] = self.sources[data_source](*args, **kwargs)
-        # register data and uncertainty in registry
-        data_src_obj = self.objects[data_source]
-        meta = [getattr(data_src_obj, m) for m in self.reg.meta_names]
-        self.reg.register(data_src_obj.data, *meta)
+        data_src_obj = data_src_cls(*args, **kwargs)
+        self.objects[data_source] = data_src_obj
+        return data_src_obj
 
     def load(self, rel_path=None):
         """
         Add data_sources to layer and open files with data for the data_source.
-        """
-        for k, v in self.layer.items():
-            self.add(k, v['module'], v.get('package'))
+        All of the opened data is registered at once after the files are read.
+        """
+        pjoin, add, open_src = os.path.join, self._load_add(Data), self._open
+        paths = {}  # full paths of each path relative to rel_path
+        data_src_objs = []
+        pending = self._pending(rel_path)
+        self._unload_changed(pending, 'data')
+        # add place holders for all data source objects at once, the data
+        # sources with files replace them when they're opened
+        self.objects.update(dict.fromkeys(k for k, _ in pending))
+        for k, v in pending:
+            add(k, v['module'], v.get('package'))
             filename = v.get('filename')
             path = v.get('path')
             if filename:
-                # default path for data is in ../data
+                # default path for data is in ../data, only join each path
+                # once for all data sources in the same folder
                 if not path:
                     path = rel_path
+                elif path in paths:
+                    path = paths[path]
                 else:
-                    path = os.path.join(rel_path, path)
+                    path = paths[path] = pjoin(rel_path, path)
                 # filename can be a list or a string, concatenate list with
-                # os.pathsep and append the full path to strings.
-                if isinstance(filename, basestring):
-                    filename = os.path.join(path, filename)
+                # os.pathsep and append the full path to strings, most are
+                # exactly str, so check that before checking subclasses
+                if type(filename) is str or isinstance(filename, basestring):
+                    filename = pjoin(path, filename)
                 else:
-                    file_list = [os.path.join(path, f) for f in filename]
-                    filename = os.path.pathsep.join(file_list)
-                self.open(k, filename)
+                    filename = os.pathsep.join(pjoin(path, f) for f in filename)
+                data_src_objs.append(open_src(k, filename))
+        self._register_all(data_src_objs, 'data')
+        self._set_loaded(pending, rel_path)
 
     def edit(self, data_src, value):
         """
@@ -218,6 +443,9 @@ class Data(Layer):
             # open file and register new data
             self.open(data_src, value['filename'], value.get('path'))
             self.layer[data_src].update(value)  # update layer with new items
+            # keep the relative path from when it was loaded
+            rel_path = self._loaded.get(data_src, (None, ))[0]
+            self._set_loaded([(data_src, self.layer[data_src])], rel_path)
 
     def delete(self, data_src):
         """
@@ -228,87 +456,65 @@ class Data(Layer):
         self.layer.pop(data_src)  # remove data source from layer
         self.objects.pop(data_src)  # remove data_source object
         self.sources.pop(data_src)  # remove data_source object
+        self._loaded.pop(data_src, None)  # load again if it's added back
 
 
-class Formulas(Layer):
+class _RegisteredLayer(Layer):
     """
-    Layer containing formulas.
+    Layer of sources that are instantiated and registered as soon as they are
+    added. Subclasses only set the registry and source classes and the
+    attribute of the source instance with the items to register.
     """
-    reg_cls = FormulaRegistry  #: formula layer registry
-    src_cls = Formula  #: formula layer source
+    __slots__ = ()
+    payload_attr = NotImplemented  #: source instance items to register
 
-    def add(self, formula, module, package=None):
+    def add(self, src_cls, module, package=None):
         """
-        Import module (from package) with formulas, import formulas and add
-        them to formula registry.
+        Add source class to layer, then instantiate it and register its items
+        and meta in the registry.
 
-        :param formula: Name of the formula source to add/open.
-        :param module: Module containing formula source.
-        :param package: [Optional] Package of formula source module.
+        :param src_cls: Name of the source class to add.
+        :param module: Module containing the source class.
+        :param package: [Optional] Package of the source class module.
 
         .. seealso::
             :func:`importlib.import_module`
         """
-        super(Formulas, self).add(formula, module, package)
-        # only update layer info if it is missing!
-        if formula not in self.layer:
-            # copy formula source parameters to :attr:`Layer.layer`
-            self.layer[formula] = {'module': module, 'package': package}
-        self.objects[formula] = self.sources[formula]()
-        # register formula and linearity in registry
-        formula_src_obj = self.objects[formula]
-        meta = [getattr(formula_src_obj, m) for m in self.reg.meta_names]
-        self.reg.register(formula_src_obj.formulas, *meta)
-
-    def open(self, formula, module, package=None):
-        self.add(formula, module, package=package)
+        self._add_source(src_cls, module, package)
+        self._register(src_cls, self.sources[src_cls]())
 
-    def load(self, _=None):
+    def _register(self, src_cls, src_obj):
         """
-        Add formulas to layer.
+        Register items and meta from source instance.
         """
-        for k, v in self.layer.items():
-            self.add(k, v['module'], v.get('package'))
-
-    def edit(self, src_cls, value):
-        pass
-
-    def delete(self, src_cls):
-        pass
-
+        self.objects[src_cls] = src_obj
+        self._reg_register(getattr(src_obj, self.payload_attr),
+                           *self._get_meta(src_obj))
+        self._set_loaded([(src_cls, self.layer[src_cls])])
 
-class Calculations(Layer):
-    """
-    Layer containing formulas.
-    """
-    reg_cls = CalcRegistry  #: calculations layer registry
-    src_cls = Calc  #: calculation layer source
-
-    def add(self, calc, module, package=None):
-        """
-        Add calc to layer.
-        """
-        super(Calculations, self).add(calc, module, package)
-        # only update layer info if it is missing!
-        if calc not in self.layer:
-            # copy calc source parameters to :attr:`Layer.layer`
-            self.layer[calc] = {'module': module, 'package': package}
-        # instantiate the calc object
-        self.objects[calc] = self.sources[calc]()
-        # register calc and dependencies in registry
-        calc_src_obj = self.objects[calc]
-        meta = [getattr(calc_src_obj, m) for m in self.reg.meta_names]
-        self.reg.register(calc_src_obj.calcs, *meta)
-
-    def open(self, calc, module, package=None):
-        self.add(calc, module, package=package)
+    def open(self, src_cls, module, package=None):
+        self.add(src_cls, module, package=package)
 
     def load(self, _=None):
         """
-        Add calcs to layer.
-        """
-        for k, v in self.layer.items():
-            self.add(k, v['module'], v.get('package'))
+        Add sources to layer. All of the sources are registered at once after
+        they're instantiated, unless a subclass overloads :meth:`add`.
+        """
+        pending = self._pending()
+        self._unload_changed(pending, self.payload_attr)
+        # subclasses that overload add register each source as it's added
+        if type(self).add is not _RegisteredLayer.add:
+            for k, v in pending:
+                self.add(k, v['module'], v.get('package'))
+            return
+        # sources in pending are from the layer, so only import them
+        for k, v in pending:
+            Layer.add(self, k, v['module'], v.get('package'))
+        # instantiate sources, and add them to objects all at once
+        src_objs = [self.sources[k]() for k, _ in pending]
+        self.objects.update(zip((k for k, _ in pending), src_objs))
+        self._register_all(src_objs, self.payload_attr)
+        self._set_loaded(pending)
 
     def edit(self, src_cls, value):
         pass
@@ -317,62 +523,49 @@ class Calculations(Layer):
         pass
 
 
-class Outputs(Layer):
+class Formulas(_RegisteredLayer):
     """
-    Layer containing output sources.
+    Layer containing formulas.
     """
-    reg_cls = OutputRegistry  #: output layer registry
-    src_cls = Output  #: output layer source
+    __slots__ = ()
+    reg_cls = _LazyImport('FormulaRegistry')  #: formula layer registry
+    src_cls = _LazyImport('Formula')  #: formula layer source
+    payload_attr = 'formulas'  #: formulas registered from formula source
 
-    def add(self, output, module, package=None):
-        """
-        Add output to
-        """
-        super(Outputs, self).add(output, module, package)
-        # only update layer info if it is missing!
-        if output not in self.layer:
-            # copy output source parameters to :attr:`Layer.layer`
-            self.layer[output] = {'module': module, 'package': package}
-        # instantiate the output object
-        self.objects[output] = self.sources[output]()
-        # register outputs and meta-data in registry
-        out_src_obj = self.objects[output]
-        meta = [getattr(out_src_obj, m) for m in self.reg.meta_names]
-        self.reg.register(out_src_obj.outputs, *meta)
-
-    def open(self, output, module, package=None):
-        self.add(output, module, package=package)
 
-    def load(self, _=None):
-        """
-        Add output_source to layer.
-        """
-        for k, v in self.layer.items():
-            self.add(k, v['module'], v.get('package'))
+class Calculations(_RegisteredLayer):
+    """
+    Layer containing calculations.
+    """
+    __slots__ = ()
+    reg_cls = _LazyImport('CalcRegistry')  #: calculations layer registry
+    src_cls = _LazyImport('Calc')  #: calculation layer source
+    payload_attr = 'calcs'  #: calculations registered from calc source
 
-    def edit(self, src_cls, value):
-        pass
 
-    def delete(self, src_cls):
-        pass
+class Outputs(_RegisteredLayer):
+    """
+    Layer containing output sources.
+    """
+    __slots__ = ()
+    reg_cls = _LazyImport('OutputRegistry')  #: output layer registry
+    src_cls = _LazyImport('Output')  #: output layer source
+    payload_attr = 'outputs'  #: outputs registered from output source
 
 
 class Simulations(Layer):
     """
     Layer containing simulation sources.
     """
-    reg_cls = SimRegistry  #: simulation layer registry
-    src_cls = Simulation  #: simulation layer source
+    __slots__ = ()
+    reg_cls = _LazyImport('SimRegistry')  #: simulation layer registry
+    src_cls = _LazyImport('Simulation')  #: simulation layer source
 
     def add(self, sim, module, package=None):
         """
         Add simulation to layer.
         """
-        super(Simulations, self).add(sim, module, package)
-        # only update layer info if it is missing!
-        if sim not in self.layer:
-            # copy simulation source parameters to :attr:`Layer.layer`
-            self.layer[sim] = {'module': module, 'package': package}
+        self._add_source(sim, module, package)
 
     def open(self, sim, filename=None):
         # call constructor of sim source with filename argument
@@ -380,16 +573,19 @@ class Simulations(Layer):
         # register simulations in registry, the only reason to register an item
         # is make sure it doesn't overwrite other items
         sim_src_obj = self.objects[sim]
-        meta = [{str(sim): getattr(sim_src_obj, m)} for m in
-                self.reg.meta_names]
-        self.reg.register({sim: sim_src_obj}, *meta)
+        meta = [{str(sim): m} for m in self._get_meta(sim_src_obj)]
+        self._reg_register({sim: sim_src_obj}, *meta)
 
     def load(self, rel_path=None):
         """
         Add sim_src to layer.
         """
-        for k, v in self.layer.items():
-            self.add(k, v['module'], v.get('package'))
+        paths = {}  # full paths of each path relative to rel_path
+        add = self._load_add(Simulations)
+        for k, v in self._pending(rel_path):
+            if k in self._loaded:
+                self.reg.unregister(k)  # inputs changed, so load it again
+            add(k, v['module'], v.get('package'))
             filename = v.get('filename')
             path = v.get('path')
             if filename:
@@ -397,10 +593,13 @@ class Simulations(Layer):
                 # default path for data is in ../simulations
                 if not path:
                     path = rel_path
+                elif path in paths:
+                    path = paths[path]
                 else:
-                    path = os.path.join(rel_path, path)
+                    path = paths[path] = os.path.join(rel_path, path)
                 filename = os.path.join(path, filename)
             self.open(k, filename)
+            self._set_loaded([(k, v)], rel_path)
 
     def edit(self, src_cls, value):
         pass
@@ -21,11 +21,11 @@ running the simulation.
 """
 
 from past.builtins import basestring
-import importlib
 import json
 import os
 import copy
 from simkit.core import logging, _listify, CommonBase, Parameter
+from simkit.core.layers import _cached_getattr
 
 LOGGER = logging.getLogger(__name__)
 LAYERS_MOD = '.layers'
@@ -174,11 +174,14 @@ class Model(metaclass=ModelBase):
         LOGGER.debug('model:\n%r', self.model)
         # initialize layers
         # FIXME: move import inside loop for custom layers in different modules
-        mod = importlib.import_module(meta.layers_mod, meta.layers_pkg)
+        layers_mod, layers_pkg = meta.layers_mod, meta.layers_pkg
         src_model = {}
         for layer, value in self.model.items():
-            # from layers module get the layer's class definition
-            layer_cls = getattr(mod, meta.layer_cls_names[layer])  # class def
+            # from layers module get the layer's class definition, the module
+            # is only imported once and each class only looked up once
+            layer_cls = _cached_getattr(
+                layers_mod, layers_pkg, meta.layer_cls_names[layer]
+            )  # class def
             self.layers[layer] = layer_cls  # add layer class def to model
             # check if model layers are classes
             src_value = {}  # layer value generated from source classes
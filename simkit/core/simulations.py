@@ -266,6 +266,8 @@ class Simulation(metaclass=SimBase):
         self._isinitialized = False
         #: order of calculations
         self.calc_order = []
+        #: dynamic calculations done over each write block at once
+        self.calc_batched = set()
         #: command queue
         self.cmd_queue = Queue()
         #: index iterator
@@ -315,17 +317,72 @@ class Simulation(metaclass=SimBase):
         self._is_data_loaded = all(data_objs.values())
         return data_objs
 
-    def initialize(self, calc_reg):
+    def initialize(self, calc_reg, out_reg=None):
         """
         Initialize the simulation. Organize calculations by dependency.
 
         :param calc_reg: Calculation registry.
         :type calc_reg:
             :class:`~simkit.core.calculation.CalcRegistry`
+        :param out_reg: Outputs registry, no calculations are batched if
+            ``None``
+        :type out_reg: :class:`~simkit.core.outputs.OutputRegistry`
         """
         self._isinitialized = True
         # TODO: if calculations are edited, loaded, added, etc. then reset
         self.calc_order = topological_sort(calc_reg.dependencies)
+        self.calc_batched = self.get_batched_calcs(calc_reg, out_reg)
+
+    def get_batched_calcs(self, calc_reg, out_reg=None):
+        """
+        Get dynamic calculations that can be done over a range of intervals.
+
+        A calculation is batched if it is dynamic, vectorizable, calculated
+        every interval, not limited by thresholds, all of its arguments are
+        names of registry items, none of its arguments or returns are outputs
+        that are properties and it only depends on static or other batched
+        calculations. Properties are copied from the previous interval at
+        every interval, so they can't be calculated ahead over a range.
+
+        :param calc_reg: Calculation registry.
+        :type calc_reg:
+            :class:`~simkit.core.calculation.CalcRegistry`
+        :param out_reg: Outputs registry, no calculations are batched if
+            ``None``
+        :type out_reg: :class:`~simkit.core.outputs.OutputRegistry`
+        :return: batched calculations
+        :rtype: set
+        """
+        batched = set()
+        if out_reg is None:
+            return batched
+        properties = {k for k, v in out_reg.isproperty.items() if v}
+        for calc in self.calc_order:
+            if not (calc_reg.is_dynamic[calc] and
+                    calc_reg.vectorizable.get(calc)):
+                continue
+            # only calculations done at every interval
+            freq = calc_reg.frequency[calc]
+            if isinstance(freq, Q_) and freq.dimensionality or freq != 1:
+                continue
+            # thresholds are evaluated at every interval
+            if self.thresholds and not calc_reg.always_calc[calc]:
+                continue
+            # no offsets, time deltas or indices into registry items
+            args = calc_reg[calc]['args']
+            if not all(isinstance(v, basestring)
+                       for a in args.values() for v in a.values()):
+                continue
+            # properties are updated from the previous interval
+            if properties.intersection(calc_reg[calc]['returns']):
+                continue
+            if properties.intersection(args.get('outputs', {}).values()):
+                continue
+            # dependencies must already be calculated for the whole range
+            if all(dep in batched or not calc_reg.is_dynamic[dep]
+                   for dep in calc_reg.dependencies[calc]):
+                batched.add(calc)
+        return batched
 
     def index_iterator(self):
         """
@@ -369,7 +426,7 @@ class Simulation(metaclass=SimBase):
         calc_reg = model.registries['calculations']
         # initialize
         if not self.isinitialized:
-            self.initialize(calc_reg)
+            self.initialize(calc_reg, out_reg)
         # default progress hook
         if not progress_hook:
             progress_hook = functools.partial(
@@ -429,20 +486,40 @@ class Simulation(metaclass=SimBase):
         # Static calculations
         # ===================
         progress_hook('static calcs')
+        is_dynamic, calculator = calc_reg.is_dynamic, calc_reg.calculator
         for calc in self.calc_order:
-            if not calc_reg.is_dynamic[calc]:
-                calc_reg.calculator[calc].calculate(
+            if not is_dynamic[calc]:
+                calculator[calc].calculate(
                     calc_reg[calc], formula_reg, data_reg, out_reg
                 )
         # ====================
         # Dynamic calculations
         # ====================
         progress_hook('dynamic calcs')
+        # frequency of each calculation in intervals, convert frequencies with
+        # units of time once instead of at every interval
+        calc_freq = {}
+        for calc in self.calc_order:
+            freq = calc_reg.frequency[calc]
+            if isinstance(freq, Q_) and freq.dimensionality:
+                freq = (freq / self.interval).to_base_units().magnitude
+            calc_freq[calc] = freq
         # TODO: assumes that interval size and indices are same, but should
         # interpolate for any size interval or indices
         for idx_tot in self.idx_iter:
             self.interval_idx = idx_tot  # update simulation interval counter
             idx = idx_tot % self.write_frequency
+            # calculate batched calculations over the entire write block
+            if self.calc_batched and not idx:
+                stop = int(min(self.write_frequency,
+                               self.number_intervals - idx_tot))
+                for calc in self.calc_order:
+                    if calc not in self.calc_batched:
+                        continue
+                    calc_reg.calculator[calc].calculate_range(
+                        calc_reg[calc], formula_reg, data_reg, out_reg,
+                        timestep=self.interval, start=0, stop=stop
+                    )
             # update properties
             for k, v in out_reg.isproperty.items():
                 # set properties from previous interval at night
@@ -458,15 +535,11 @@ class Simulation(metaclass=SimBase):
             for calc in self.calc_order:
                 # Determine if calculation is scheduled for this timestep
                 # TODO: add ``start_at`` parameter combined with ``frequency``
-                freq = calc_reg.frequency[calc]
-                if not freq.dimensionality:
-                    is_scheduled = (idx_tot % freq) == 0
-                else:
-                    # Frequency with units of time
-                    is_scheduled = ((idx_tot * self.interval) % freq) == 0
+                is_scheduled = (idx_tot % calc_freq[calc]) == 0
                 is_scheduled = (
                     is_scheduled and (not night or calc_reg.always_calc[calc])
                 )
+                is_scheduled = is_scheduled and calc not in self.calc_batched
                 if calc_reg.is_dynamic[calc] and is_scheduled:
                     calc_reg.calculator[calc].calculate(
                         calc_reg[calc], formula_reg, data_reg, out_reg,
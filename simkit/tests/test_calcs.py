@@ -6,6 +6,7 @@ from nose.tools import ok_, eq_
 from simkit.core.calculations import Calc, CalcParameter
 from simkit.core.calculators import Calculator
 from simkit.tests import PROJ_PATH, sandia_performance_model
+from uncertainty_wrapper import unc_wrapper_args
 import os
 import uncertainties
 from pvlib.solarposition import get_solarposition as solpos
@@ -119,6 +120,75 @@ def test_static_calc_unc():
     return test_model, test_unc
 
 
+def test_get_covariance():
+    """
+    Test covariance matrix from data and output variances.
+    """
+    datargs = {'x': 'a'}
+    outargs = {'y': 'b'}
+    datvar = {'a': {'a': np.array([1.0, 2.0]), 'b': np.array([0.5, 0.5])}}
+    outvar = {'b': {'b': np.array([3.0, 4.0])}}
+    cov = Calculator.get_covariance(datargs, outargs, ['x', 'y'],
+                                    datvar, outvar)
+    eq_(cov.shape, (2, 2, 2))
+    # Fortran order, so each observation slice is contiguous
+    ok_(cov.flags['F_CONTIGUOUS'])
+    ok_(cov[:, 0, 1].flags['C_CONTIGUOUS'])
+    assert np.allclose(cov[:, 0, 0], [1.0, 2.0])
+    assert np.allclose(cov[:, 0, 1], [0.5, 0.5])
+    # missing covariances are zero
+    assert np.allclose(cov[:, 1, 0], [0.0, 0.0])
+    assert np.allclose(cov[:, 1, 1], [3.0, 4.0])
+    # scalar variances are one observation, so extra dimensions are squeezed
+    datvar = {'a': {'a': 1.0}}
+    outvar = {'b': {'b': 3.0, 'a': 0.25}}
+    cov = Calculator.get_covariance(datargs, outargs, ['x', 'y'],
+                                    datvar, outvar)
+    eq_(cov.shape, (2, 2))
+    assert np.allclose(cov, [[1.0, 0.0], [0.25, 3.0]])
+
+
+class RegistryTest(dict):
+    """
+    Registry with only the meta used by calculators.
+    """
+    def __init__(self, *args, **kwargs):
+        super(RegistryTest, self).__init__(*args, **kwargs)
+        self.args = {}
+        self.isconstant = {}
+        self.variance = {}
+        self.uncertainty = {}
+        self.jacobian = {}
+
+
+def f_prod_sum(x, y):
+    return x * y, x + y
+
+
+def test_calculate_unc():
+    """
+    Test relative covariance of returns without units, which the uncertainty
+    wrapper returns as a sequence.
+    """
+    formula_reg = RegistryTest(f_prod_sum=unc_wrapper_args(0, 1)(f_prod_sum))
+    formula_reg.args['f_prod_sum'] = ['x', 'y']
+    formula_reg.isconstant['f_prod_sum'] = []
+    data_reg = RegistryTest(a=2.0, b=3.0)
+    data_reg.variance = {'a': {'a': 0.01}, 'b': {'b': 0.04}}
+    out_reg = RegistryTest()
+    calc = {'formula': 'f_prod_sum', 'args': {'data': {'x': 'a', 'y': 'b'}},
+            'returns': ['p', 's']}
+    Calculator.calculate(calc, formula_reg, data_reg, out_reg)
+    ok_(np.allclose(out_reg['p'], 6.0))
+    ok_(np.allclose(out_reg['s'], 5.0))
+    # relative variances of product add, sum is weighted by the values
+    ok_(np.allclose(out_reg.variance['p']['p'], 0.05))
+    ok_(np.allclose(out_reg.variance['s']['s'], 0.4 / 25.0))
+    ok_(np.allclose(out_reg.variance['p']['s'], 0.84 / 30.0))
+    ok_(np.allclose(out_reg.jacobian['p']['a'], 3.0))
+    ok_(np.allclose(out_reg.jacobian['s']['b'], 1.0))
+
+
 if __name__ == '__main__':
     tm, tu = test_static_calc_unc()
     test_calc_metaclass()
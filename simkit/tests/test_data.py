@@ -2,13 +2,21 @@
 Test data sources
 """
 
-from nose.tools import ok_, eq_
+from nose.tools import ok_, eq_, raises
 from simkit.tests import logging
 from simkit.core import UREG
 from simkit.core.data_sources import DataSource, DataParameter
-from simkit.core.data_readers import XLRDReader
+from simkit.core import data_readers
+from simkit.core.data_readers import (
+    DataReader, JSONReader, MixedTextXLS, XLRDReader
+)
+from simkit.core.exceptions import MixedTextNoMatchError
 from simkit.tests import PROJ_PATH, TESTS_DIR
+import numpy as np
+import json
 import os
+import shutil
+import tempfile
 
 LOGGER = logging.getLogger(__name__)
 LOGGER.setLevel(logging.DEBUG)
@@ -176,6 +184,282 @@ def test_xlrdreader_datasource():
     LOGGER.debug('xlrdreader_testdata.xlsx.json has been cleaned')
 
 
+def test_xlrdreader_return_magnitudes():
+    """
+    Test xlrd reader returns magnitudes and keeps units separately.
+    """
+
+    class XLRDReaderMagnitudes(XLRDReader):
+        return_magnitudes = True
+
+    parameters = {
+        'GHI': {
+            'units': 'W/m**2',
+            'extras': {'range': [[2, 24], 1], 'sheet': 'Sheet1'}
+        }
+    }
+    data = XLRDReader(parameters).load_data(XLRDREADER_TESTDATA)
+    reader = XLRDReaderMagnitudes(parameters)
+    magnitudes = reader.load_data(XLRDREADER_TESTDATA)
+    ok_(isinstance(magnitudes['GHI'], np.ndarray))
+    ok_(np.allclose(magnitudes['GHI'], data['GHI'].magnitude))
+    eq_(reader.units['GHI'], data['GHI'].units)
+
+
+def test_unit_scaled():
+    """
+    Test units are parsed once, and scaled units are parsed as quantities.
+    """
+    eq_(data_readers._unit('W'), UREG.W)
+    ok_(data_readers._unit('W') is data_readers._unit('W'))
+    kilowatts = data_readers._quantity([1.0, 2.0], data_readers._unit('1e3*W'))
+    eq_(kilowatts.u, UREG.W)
+    ok_(np.allclose(kilowatts.m, [1e3, 2e3]))
+
+
+def test_xlrdreader_npz_cache():
+    """
+    Test xlrd reader caches numeric data as ".npz" until the workbook changes.
+    """
+
+    class XLRDReaderNPZ(XLRDReader):
+        npz_cache = True
+
+    parameters = {
+        'GHI': {
+            'units': 'W/m**2',
+            'extras': {'range': [[2, 24], 1], 'sheet': 'Sheet1'}
+        }
+    }
+    tmp_path = tempfile.mkdtemp()
+    filename = os.path.join(tmp_path, 'xlrdreader_testdata.xlsx')
+    npz_file = filename + '.npz'
+    shutil.copyfile(XLRDREADER_TESTDATA, filename)
+    try:
+        reader = XLRDReaderNPZ(parameters)
+        data = reader.load_data(filename)
+        ok_(os.path.exists(npz_file))
+        # load the saved ".npz" instead of the workbook
+        np.savez(npz_file, GHI=data['GHI'].magnitude * 2.0)
+        wb_mtime = os.path.getmtime(filename)
+        os.utime(npz_file, (wb_mtime + 1.0, wb_mtime + 1.0))
+        cached = reader.load_data(filename)
+        eq_(cached['GHI'].units, data['GHI'].units)
+        ok_(np.allclose(cached['GHI'].magnitude, data['GHI'].magnitude * 2.0))
+        # workbook modified since, so read it again and save a new ".npz"
+        os.utime(filename, (wb_mtime + 2.0, wb_mtime + 2.0))
+        reloaded = reader.load_data(filename)
+        ok_(np.allclose(reloaded['GHI'].magnitude, data['GHI'].magnitude))
+        with np.load(npz_file) as npz:
+            ok_(np.allclose(npz['GHI'], data['GHI'].magnitude))
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+class TextSheet(object):
+    """
+    Worksheet with numbers and names stored as text.
+    """
+    values = ['1.5', '2.0', '3']
+
+    def col_values(self, colx, start_rowx=0, end_rowx=None):
+        return self.values[start_rowx:end_rowx]
+
+    def cell_value(self, rowx, colx):
+        return 'TMY'
+
+
+def test_xlrdreader_read_range_text():
+    """
+    Test xlrd reader coerces numbers stored as text, and keeps other text.
+    """
+    pval = {'units': 'W', 'extras': {'range': [[0, 3], 0]}}
+    datum = XLRDReader._read_range(TextSheet(), pval)
+    eq_(datum.u, UREG.W)
+    ok_(np.allclose(datum.m, [1.5, 2.0, 3.0]))
+    pval = {'units': None, 'extras': {'range': [0, 0]}}
+    eq_(XLRDReader._read_range(TextSheet(), pval), 'TMY')
+
+
+def test_load_json_nan():
+    """
+    Test cached JSON with NaN, as written by :func:`json.dump`, is loaded by
+    every JSON parser, including when large files are streamed.
+    """
+    fid, filename = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fid, 'w') as fp:
+        json.dump({'data': {'a': [1.0, float('nan')]}}, fp)
+    orjson, mmap_size = data_readers.orjson, data_readers.JSON_MMAP_SIZE
+    try:
+        for parser in (orjson, None):
+            # without orjson every file is large enough to be streamed
+            data_readers.orjson, data_readers.JSON_MMAP_SIZE = parser, 0
+            data = data_readers._load_json(filename)
+            eq_(data['data']['a'][0], 1.0)
+            ok_(np.isnan(data['data']['a'][1]))
+    finally:
+        data_readers.orjson, data_readers.JSON_MMAP_SIZE = orjson, mmap_size
+        os.remove(filename)
+
+
+class TextReader(DataReader):
+    """
+    Original reader of a data file cached as JSON.
+    """
+    def load_data(self, filename, *args, **kwargs):
+        with open(filename) as fp:
+            return {'text': fp.read()}
+
+    def apply_units_to_cache(self, data):
+        return data
+
+
+def _save_cache(orig_filename):
+    """
+    Cache original file as JSON, the same as
+    :meth:`~simkit.core.data_sources.DataSource.saveas_json`.
+    """
+    orig_stat = os.stat(orig_filename)
+    json_data = {'data': {'text': 'cached'},
+                 'orig_size': orig_stat.st_size,
+                 'orig_mtime_ns': orig_stat.st_mtime_ns,
+                 'content_hash': data_readers._file_hash(orig_filename)}
+    with open(orig_filename + '.json', 'w') as fp:
+        json.dump(json_data, fp)
+
+
+def test_jsonreader_cache_invalidation():
+    """
+    Test JSON cache is only used until the original file's content changes.
+    """
+
+    class Meta(object):
+        data_reader = TextReader
+
+    reader = JSONReader({}, Meta)
+    fid, orig_filename = tempfile.mkstemp(suffix='.txt')
+    cache_filename = orig_filename + '.json'
+    try:
+        with os.fdopen(fid, 'w') as fp:
+            fp.write('abc')
+        _save_cache(orig_filename)
+        eq_(reader.load_data(orig_filename), {'text': 'cached'})
+        # modified but same content, so the hash still matches
+        orig_mtime_ns = os.stat(orig_filename).st_mtime_ns
+        os.utime(orig_filename, ns=(orig_mtime_ns, orig_mtime_ns + 10 ** 9))
+        eq_(reader.load_data(orig_filename), {'text': 'cached'})
+        # same size but different content, checked right after the last load
+        with open(orig_filename, 'w') as fp:
+            fp.write('xyz')
+        os.utime(orig_filename, ns=(orig_mtime_ns, orig_mtime_ns + 2 * 10 ** 9))
+        eq_(reader.load_data(orig_filename), {'text': 'xyz'})
+        ok_(not os.path.exists(cache_filename))
+        # different size
+        _save_cache(orig_filename)
+        eq_(reader.load_data(orig_filename), {'text': 'cached'})
+        with open(orig_filename, 'w') as fp:
+            fp.write('abcd')
+        eq_(reader.load_data(orig_filename), {'text': 'abcd'})
+        ok_(not os.path.exists(cache_filename))
+    finally:
+        os.remove(orig_filename)
+        if os.path.exists(cache_filename):
+            os.remove(cache_filename)
+
+
+def test_split_chars():
+    """
+    Test only character classes of literal characters are split without regex,
+    the same as :func:`re.split`.
+    """
+    eq_(data_readers._trivial_split_chars('[,;]'), ',;')
+    eq_(data_readers._trivial_split_chars('[,]'), ',')
+    for pattern in (',', '[\\s,]', '[^,]', '[0-9]', '[,;]+', '[]'):
+        ok_(data_readers._trivial_split_chars(pattern) is None)
+    split = data_readers._split_chars(',;')
+    eq_(split('0.1,0.2;0.3'), ['0.1', '0.2', '0.3'])
+    eq_(split('0.1,,0.2'), ['0.1', '', '0.2'])
+    eq_(data_readers._split_chars(',')('0.1,0.2'), ['0.1', '0.2'])
+
+
+class MixedTextCells(MixedTextXLS):
+    """
+    Mixed text reader with the cell text given instead of read from a workbook.
+    """
+    cells = {
+        'sigma': 'Std = 0.4985',
+        'coeffs': 'a = 1.0, b = 2.5 and c = 3e2',
+        'triple': 'diode (1, 2, 3)',
+        'cov': '0.1,0.2;0.3',
+        'pairs': '(1, 2) (3, 4)'
+    }
+
+    def _load_workbook(self, filename):
+        return dict(self.cells)
+
+
+def test_mixedtextxls_re_plan():
+    """
+    Test mixed text reader replays its plan for each regex method.
+    """
+    parameters = {
+        'Sheet1': {
+            'sigma': {
+                'pattern': '\\w+ = ([-+]?(?:\\d+(?:\\.\\d*)?|\\.\\d+)'
+                           '(?:[eE][-+]?\\d+)?)',
+                'method': 'match'
+            },
+            'coeffs': {'method': 'findall', 'units': 'W'},
+            'triple': {
+                'pattern': '\\((\\d+), (\\d+), (\\d+)\\)', 'method': 'search'
+            },
+            'cov': {'pattern': '[,;]', 'method': 'split'}
+        },
+        'Sheet2': {
+            'pairs': {'pattern': '\\((\\d+), (\\d+)\\)', 'method': 'findall'}
+        }
+    }
+    reader = MixedTextCells(parameters)
+    eq_([step[0] for step in reader.re_plan],
+        ['sigma', 'coeffs', 'triple', 'cov', 'pairs'])
+    # loading twice replays the same plan
+    for _ in range(2):
+        data = reader.load_data('mixed_text.xlsx')
+        ok_(np.allclose(data['sigma'].m, 0.4985))
+        ok_(np.allclose(data['coeffs'].m, [1.0, 2.5, 300.0]))
+        eq_(data['coeffs'].u, UREG.W)
+        ok_(np.allclose(data['triple'].m, [1.0, 2.0, 3.0]))
+        ok_(np.allclose(data['cov'].m, [0.1, 0.2, 0.3]))
+        ok_(np.allclose(data['pairs'].m, [[1.0, 2.0], [3.0, 4.0]]))
+
+
+@raises(AttributeError)
+def test_mixedtextxls_method_whitelist():
+    """
+    Test mixed text reader only allows whitelisted regex methods.
+    """
+    MixedTextCells({'Sheet1': {'sigma': {'method': 'sub'}}})
+
+
+@raises(MixedTextNoMatchError)
+def test_mixedtextxls_no_match():
+    """
+    Test mixed text reader raises if the text doesn't match.
+    """
+    reader = MixedTextCells({'Sheet1': {'sigma': {'pattern': 'x = (\\d+)'}}})
+    reader.load_data('mixed_text.xlsx')
+
+
 if __name__ == '__main__':
     test_datasource_metaclass()
     test_xlrdreader_datasource()
+    test_xlrdreader_return_magnitudes()
+    test_xlrdreader_npz_cache()
+    test_unit_scaled()
+    test_xlrdreader_read_range_text()
+    test_load_json_nan()
+    test_jsonreader_cache_invalidation()
+    test_split_chars()
+    test_mixedtextxls_re_plan()
+    test_mixedtextxls_method_whitelist()
+    test_mixedtextxls_no_match()
@@ -6,10 +6,13 @@ from nose.tools import ok_, eq_
 import numpy as np
 from simkit.core import UREG
 from simkit.core.formulas import (
-    Formula, NumericalExpressionImporter, FormulaParameter
+    Formula, NumericalExpressionImporter, FormulaParameter, _import_from_path
 )
 from simkit.tests import PROJ_PATH
 import os
+import shutil
+import sys
+import tempfile
 
 
 def test_formulas_metaclass():
@@ -44,7 +47,7 @@ def test_formulas_metaclass():
 
     formulas_test2 = FormulaTest2()
     ok_(isinstance(formulas_test2, Formula))
-    for k, v in formulas_test2.parameters.iteritems():
+    for k, v in formulas_test2.parameters.items():
         eq_(formulas_test1.parameters[k], v)
 
 
@@ -91,5 +94,66 @@ def test_numexpr_formula():
     return numexpr_formula
 
 
+def test_numexpr_formulas_bind_own_expression():
+    """
+    Test each ``numexpr`` formula evaluates its own expression.
+    """
+
+    class NumexprFormulas(Formula):
+        f_sum = FormulaParameter(expression='a + b', args=['a', 'b'])
+        f_product = FormulaParameter(expression='x * y', args=['x', 'y'])
+
+        class Meta:
+            formula_importer = NumericalExpressionImporter
+
+    numexpr_formulas = NumexprFormulas()
+    f_sum = numexpr_formulas.formulas['f_sum']
+    f_product = numexpr_formulas.formulas['f_product']
+    ok_(np.allclose(f_sum([3.0, 12.0], [4.0, 5.0]), [[7.0, 17.0]]))
+    ok_(np.allclose(f_product([3.0, 12.0], [4.0, 5.0]), [[12.0, 60.0]]))
+
+
+def test_import_formulas_from_path():
+    """
+    Test formulas in a package that isn't on the path are imported from their
+    file, and relative imports in the package work.
+    """
+    tmp_path = tempfile.mkdtemp()
+    pkg = os.path.join(tmp_path, 'simkit_test_formulas')
+    os.mkdir(pkg)
+    with open(os.path.join(pkg, '__init__.py'), 'w') as f:
+        f.write('')
+    with open(os.path.join(pkg, 'helpers.py'), 'w') as f:
+        f.write('def double(x):\n    return 2 * x\n')
+    with open(os.path.join(pkg, 'quad.py'), 'w') as f:
+        f.write('from .helpers import double\n\n\n'
+                'def f_quad(x):\n    return double(double(x))\n')
+
+    class PathFormula(Formula):
+        f_quad = FormulaParameter(args=['x'])
+
+        class Meta:
+            module = '.quad'
+            package = 'simkit_test_formulas'
+            path = tmp_path
+
+    try:
+        path_formula = PathFormula()
+        eq_(path_formula.formulas['f_quad'](3.0), 12.0)
+        # module is an attribute of its parent package
+        quad = sys.modules['simkit_test_formulas.quad']
+        ok_(sys.modules['simkit_test_formulas'].quad is quad)
+        ok_(_import_from_path('simkit_test_formulas.quad', tmp_path) is not None)
+        ok_(_import_from_path('simkit_test_formulas.missing', tmp_path) is None)
+        ok_('simkit_test_formulas.missing' not in sys.modules)
+    finally:
+        for name in ('simkit_test_formulas', 'simkit_test_formulas.helpers',
+                     'simkit_test_formulas.quad'):
+            sys.modules.pop(name, None)
+        shutil.rmtree(tmp_path)
+
+
 if __name__ == '__main__':
     f = test_numexpr_formula()
+    test_numexpr_formulas_bind_own_expression()
+    test_import_formulas_from_path()
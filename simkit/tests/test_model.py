@@ -5,6 +5,8 @@ test model
 
 from nose.tools import ok_, eq_
 from simkit.core.models import Model, ModelParameter
+from simkit.core.layers import Outputs
+from simkit.core.outputs import Output, OutputParameter
 from simkit.tests import PROJ_PATH, sandia_performance_model, logging
 import os
 
@@ -185,5 +187,37 @@ class PVPowerSAPM4(Model):
         modelpath = PROJ_PATH
 
 
+class LayerTestOutput(Output):
+    q = OutputParameter(units='W')
+
+
+class CountingOutputs(Outputs):
+    """
+    Outputs layer that overloads add.
+    """
+    def add(self, src_cls, module, package=None):
+        self.added.append(src_cls)
+        super(CountingOutputs, self).add(src_cls, module, package)
+
+
+def test_layer_load_add():
+    """
+    Test loading a layer only imports its sources, unless add is overloaded.
+    """
+    layer = {'LayerTestOutput': {'module': 'simkit.tests.test_model'}}
+    outputs = Outputs(dict(layer))
+    outputs.load()
+    ok_('q' in outputs.reg)
+    eq_(outputs.layer, layer)
+    counting_outputs = CountingOutputs(dict(layer))
+    counting_outputs.added = []
+    counting_outputs.load()
+    eq_(counting_outputs.added, ['LayerTestOutput'])
+    ok_('q' in counting_outputs.reg)
+    # loading again doesn't add unchanged sources
+    counting_outputs.load()
+    eq_(counting_outputs.added, ['LayerTestOutput'])
+
+
 if __name__ == '__main__':
     test_simkit_model()
@@ -2,6 +2,7 @@
 Simulation tests.
 """
 
+from nose.tools import eq_
 from simkit.core import logging, UREG
 from simkit.core.models import Model, ModelParameter
 from simkit.core.data_sources import DataParameter, DataSource
@@ -137,5 +138,134 @@ def test_call_sim_with_args():
     return m1
 
 
+class RampData(DataSource):
+    x = DataParameter(**{'units': 'cm', 'argpos': 0})
+
+    class Meta:
+        data_cache_enabled = False
+        data_reader = ArgumentReader
+
+    def __prepare_data__(self):
+        pass
+
+
+class RampOutput(Output):
+    y = OutputParameter(**{'units': 'cm'})
+    z = OutputParameter(**{'units': 'cm', 'isproperty': True})
+
+
+def f_double(x):
+    return np.reshape(2.0 * x, (-1, 1)),
+
+
+class RampFormula(Formula):
+    f_double = FormulaParameter(args=['x'])
+
+    class Meta:
+        module = 'simkit.tests.test_sim'
+
+
+RAMP_CALCS = {
+    'double_x': {
+        'formula': 'f_double', 'args': {'data': {'x': 'x'}}, 'returns': ['y']
+    },
+    'double_y': {
+        'formula': 'f_double', 'args': {'outputs': {'x': 'y'}},
+        'returns': ['z'], 'dependencies': ['double_x']
+    }
+}
+
+
+class RampCalc(Calc):
+    double_x = CalcParameter(**RAMP_CALCS['double_x'])
+    double_y = CalcParameter(**RAMP_CALCS['double_y'])
+
+    class Meta:
+        is_dynamic = True
+
+
+class BatchedRampCalc(Calc):
+    double_x = CalcParameter(**RAMP_CALCS['double_x'])
+    double_y = CalcParameter(**RAMP_CALCS['double_y'])
+
+    class Meta:
+        is_dynamic = True
+        vectorizable = True
+
+
+class RampSim(Simulation):
+    settings = SimParameter(
+        ID='Ramp',
+        commands=['start', 'load', 'run', 'pause'],
+        path='~/SimKit_Tests',
+        thresholds=None,
+        interval=[1, 'hour'],
+        sim_length=[4, 'hour'],
+        write_frequency=4,
+        write_fields={'data': ['x'], 'outputs': ['y', 'z']},
+        display_frequency=4,
+        display_fields={'data': ['x'], 'outputs': ['y', 'z']},
+    )
+
+
+class RampModel(Model):
+    data = ModelParameter(sources=[RampData])
+    outputs = ModelParameter(sources=[RampOutput])
+    formulas = ModelParameter(sources=[RampFormula])
+    calculations = ModelParameter(sources=[RampCalc])
+    simulations = ModelParameter(sources=[RampSim])
+
+    class Meta:
+        modelpath = os.path.dirname(__file__)
+
+
+class BatchedRampModel(Model):
+    data = ModelParameter(sources=[RampData])
+    outputs = ModelParameter(sources=[RampOutput])
+    formulas = ModelParameter(sources=[RampFormula])
+    calculations = ModelParameter(sources=[BatchedRampCalc])
+    simulations = ModelParameter(sources=[RampSim])
+
+    class Meta:
+        modelpath = os.path.dirname(__file__)
+
+
+def _no_progress(format_args, display_header=False):
+    pass
+
+
+def test_dynamic_calc_first_interval():
+    """
+    Test dynamic calculations get data at the first interval, not all of it.
+    """
+    data = {'RampData': {'x': np.arange(1.0, 5.0)}}
+    m1 = RampModel()
+    m1.command('run', progress_hook=_no_progress, data=data)
+    out_reg = m1.registries['outputs']
+    assert np.allclose(out_reg['y'].m.flatten(), [2.0, 4.0, 6.0, 8.0])
+    assert np.allclose(out_reg['z'].m.flatten(), [4.0, 8.0, 12.0, 16.0])
+    return m1
+
+
+def test_batched_calcs():
+    """
+    Test vectorizable dynamic calculations done over the whole write block
+    give the same outputs as calculating them at each interval.
+    """
+    data = {'RampData': {'x': np.arange(1.0, 5.0)}}
+    m1 = RampModel()
+    m1.command('run', progress_hook=_no_progress, data=data)
+    m2 = BatchedRampModel()
+    m2.command('run', progress_hook=_no_progress, data=data)
+    eq_(m1.simulations.reg['RampSim'].calc_batched, set())
+    # calculations with properties in their returns are never batched
+    eq_(m2.simulations.reg['RampSim'].calc_batched, {'double_x'})
+    out1, out2 = m1.registries['outputs'], m2.registries['outputs']
+    for k in ('y', 'z'):
+        assert np.allclose(out1[k].m, out2[k].m)
+    assert np.allclose(out2['y'].m.flatten(), [2.0, 4.0, 6.0, 8.0])
+    return m1, m2
+
+
 if __name__ == '__main__':
     m = test_call_sim_with_args()